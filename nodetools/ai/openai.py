@@ -153,6 +153,69 @@ class OpenAIRequestTool:
         ]
         return await asyncio.gather(*tasks)
 
+    async def submit_batch_chat_completions(self, arg_async_map: dict, completion_window: str = '24h') -> str:
+        '''Submit chat completions to the OpenAI Batch API and return the batch id.
+
+        Batch requests are billed at a discount and don't count against the synchronous
+        rate limit, so use this for work that can wait (up to completion_window) for results.
+        Only available when talking to OpenAI directly; OpenRouter has no batch endpoint.
+        '''
+        if self.using_openrouter:
+            raise ValueError("Batch chat completions require a direct OpenAI API key, not OpenRouter")
+
+        batch_lines = [
+            json.dumps({
+                "custom_id": job_name,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._prepare_api_args(api_args=api_args)
+            })
+            for job_name, api_args in arg_async_map.items()
+        ]
+        batch_file = await self.async_client.files.create(
+            file=(f"batch_{self.generate_job_hash()}.jsonl", "\n".join(batch_lines).encode()),
+            purpose="batch"
+        )
+        batch = await self.async_client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=completion_window
+        )
+        logger.debug(f"OpenAIRequestTool.submit_batch_chat_completions: Submitted batch {batch.id} with {len(batch_lines)} requests")
+        return batch.id
+
+    async def get_batch_chat_completions(self, batch_id: str) -> dict | None:
+        '''Get the results of a submitted batch.
+
+        Returns None while the batch is still running, otherwise a dict mapping each job name
+        to its chat completion response body (None for requests that failed).
+        '''
+        batch = await self.async_client.batches.retrieve(batch_id)
+        if batch.status not in ('completed', 'failed', 'expired', 'cancelled'):
+            return None
+        if batch.status != 'completed':
+            logger.error(f"OpenAIRequestTool.get_batch_chat_completions: Batch {batch_id} ended with status {batch.status}")
+
+        results = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            content = await self.async_client.files.content(file_id)
+            for line in content.text.splitlines():
+                if not line:
+                    continue
+                item = json.loads(line)
+                response = item.get('response') or {}
+                results[item['custom_id']] = response.get('body') if response.get('status_code') == 200 else None
+        return results
+
+    async def run_batch_chat_completions(self, arg_async_map: dict, poll_interval: int = 60) -> dict:
+        '''Submit a batch and wait for it to finish. Jobs missing from the results map to None.'''
+        batch_id = await self.submit_batch_chat_completions(arg_async_map=arg_async_map)
+        while (results := await self.get_batch_chat_completions(batch_id)) is None:
+            await asyncio.sleep(poll_interval)
+        return {job_name: results.get(job_name) for job_name in arg_async_map}
+
     def create_writable_df_for_async_chat_completion(self, arg_async_map):
         '''Create DataFrame for async chat completion results'''
         nest_asyncio.apply()
@@ -6,8 +6,12 @@ import asyncio
 import nest_asyncio
 import json
 import time
+import copy
+import hashlib
+from collections import OrderedDict
 from asyncio import Semaphore
 from nodetools.protocols.credentials import CredentialManager
+from nodetools.configuration.constants import LLM_RESPONSE_CACHE_TTL, LLM_RESPONSE_CACHE_SIZE
 from loguru import logger
 from typing import Dict, Any
 import traceback
@@ -53,6 +57,8 @@ class OpenRouterTool:
             self.semaphore = Semaphore(max_concurrent_requests)
             self.rate_limit = requests_per_minute
             self.request_times = []
+            self._response_cache: OrderedDict[str, tuple[float, Dict[str, Any]]] = OrderedDict()  # key -> (expiry, response)
+            self._inflight_completions: Dict[str, asyncio.Future] = {}  # key -> pending response shared by identical calls
             self.__class__._initialized = True
 
     def _prepare_headers(self):
@@ -304,7 +310,9 @@ class OpenRouterTool:
             model: str,
             system_prompt: str,
             user_prompt: str,
-            temperature: float = 0
+            temperature: float = 0,
+            cache_system_prompt: bool = False,
+            use_cache: bool = False
         ) -> Dict[str, Any]:
         """
         Create a single chat completion with system and user prompts.
@@ -314,20 +322,65 @@ class OpenRouterTool:
             system_prompt: The system prompt to set context
             user_prompt: The user's prompt/question
             temperature: Sampling temperature (default: 0 for deterministic output)
+            cache_system_prompt: If True, mark the system prompt as a prompt-cache breakpoint.
+                Use for large system prompts that are identical across calls, keeping anything
+                that varies per call in user_prompt. Providers that cache automatically ignore it.
+            use_cache: If True and temperature is 0, reuse a previous response for identical
+                (model, system_prompt, user_prompt) instead of calling the API again.
+                Identical calls made while one is already in flight share its API request.
             
         Returns:
             Dict containing the completion response
         """
+        cache_key = None
+        inflight = None
+        if use_cache and temperature == 0:
+            # JSON-encoded so prompts containing the separator can't collide with other (model, prompt) combinations
+            cache_key = hashlib.sha256(
+                json.dumps([model, system_prompt, user_prompt]).encode()
+            ).hexdigest()
+            while True:
+                cached = self._response_cache.get(cache_key)
+                if cached is not None:
+                    expires_at, response = cached
+                    if expires_at > time.monotonic():
+                        self._response_cache.move_to_end(cache_key)
+                        return copy.deepcopy(response)
+                    del self._response_cache[cache_key]
+
+                pending = self._inflight_completions.get(cache_key)
+                if pending is None:
+                    break
+                # An identical request is already running; wait for it instead of issuing another
+                try:
+                    return copy.deepcopy(await asyncio.shield(pending))
+                except asyncio.CancelledError:
+                    if not pending.cancelled() or asyncio.current_task().cancelling():
+                        raise  # This caller was cancelled
+                    # Only the caller that issued the request was cancelled; look again and issue our own if needed
+            inflight = asyncio.get_running_loop().create_future()
+            self._inflight_completions[cache_key] = inflight
+
         try:
             # Wait for rate limiting
             await self.wait_for_rate_limit()
 
+            if cache_system_prompt:
+                # OpenRouter passes cache_control through to providers with explicit prompt caching (e.g. Anthropic)
+                system_content = [{
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"}
+                }]
+            else:
+                system_content = system_prompt
+
             # Create completion
             completion = await self.async_client.chat.completions.create(
                 extra_headers=self._prepare_headers(),
                 model=model,
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": system_content},
                     {"role": "user", "content": user_prompt}
                 ],
                 temperature=temperature
@@ -336,7 +389,7 @@ class OpenRouterTool:
             # Add current time to rate limiting tracker
             self.request_times.append(time.time())
 
-            return {
+            response = {
                 "id": completion.id,
                 "model": completion.model,
                 "choices": [{
@@ -348,7 +401,27 @@ class OpenRouterTool:
                 "usage": completion.usage.model_dump()
             }
 
+            if cache_key is not None:
+                self._response_cache[cache_key] = (time.monotonic() + LLM_RESPONSE_CACHE_TTL, copy.deepcopy(response))
+                if len(self._response_cache) > LLM_RESPONSE_CACHE_SIZE:
+                    self._response_cache.popitem(last=False)
+
+            if inflight is not None:
+                inflight.set_result(copy.deepcopy(response))
+
+            return response
+
         except Exception as e:
             logger.error(f"Error in create_single_chat_completion: {e}")
             logger.error(traceback.format_exc())
+            if inflight is not None:
+                inflight.set_exception(e)
+                inflight.exception()  # Mark as retrieved; waiters (if any) still receive it
             raise
+
+        finally:
+            if inflight is not None:
+                if not inflight.done():
+                    inflight.cancel()  # Caller was cancelled; waiters fall back to their own request
+                if self._inflight_completions.get(cache_key) is inflight:
+                    del self._inflight_completions[cache_key]
@@ -41,7 +41,7 @@ class PFTTransactionModal(discord.ui.Modal, title='Send PFT'):
         )
 
         # send memo with PFT attached
-        response = self.generic_pft_utilities.send_memo(
+        response = await self.generic_pft_utilities.send_memo(
             wallet_seed_or_wallet=self.wallet,
             destination=destination_address,
             memo=memo,
@@ -50,6 +50,8 @@ class PFTTransactionModal(discord.ui.Modal, title='Send PFT'):
         )
 
         # extract response from last memo
+        if isinstance(response, list):
+            response = response[-1]
         tx_info = self.generic_pft_utilities.extract_transaction_info_from_response_object(response)['clean_string']
 
         await interaction.followup.send(
@@ -98,9 +100,9 @@ class XRPTransactionModal(discord.ui.Modal, title='XRP Transaction Details'):
             # Convert destination_tag to integer if it exists
             dt = int(destination_tag) if destination_tag else None
 
-            # Call the send_xrp_with_info__seed_based function
-            response = self.generic_pft_utilities.send_xrp_with_info__seed_based(
-                wallet_seed=self.wallet,
+            # Submit through the async XRPL client so the bot's event loop isn't blocked while waiting for validation
+            response = await self.generic_pft_utilities.send_xrp(
+                wallet_seed_or_wallet=self.wallet,
                 amount=amount,
                 destination=destination_address,
                 memo=memo,
@@ -1,6 +1,7 @@
 from enum import Enum
 from decimal import Decimal
 from pathlib import Path
+import sys
 
 CONFIG_DIR = Path.home().joinpath("postfiatcreds")
 
@@ -10,8 +11,11 @@ DEFAULT_OPEN_AI_MODEL = 'chatgpt-4o-latest'
 DEFAULT_ANTHROPIC_MODEL = 'claude-3-5-sonnet-20241022'
 
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+LLM_RESPONSE_CACHE_TTL = 86400  # Seconds a cached chat completion is reused
+LLM_RESPONSE_CACHE_SIZE = 1_000  # Max cached chat completions
 
 # XRPL CONSTANTS
+TES_SUCCESS = sys.intern('tesSUCCESS')  # Interned so comparisons against interned results short-circuit on identity
 MIN_XRP_PER_TRANSACTION = Decimal('0.000001')  # Minimum XRP amount per transaction
 MIN_XRP_BALANCE = 2  # Minimum XRP balance to be able to perform a transaction, corresponding to XRP reserve
 MAX_CHUNK_SIZE = 1024
@@ -19,6 +23,18 @@ XRP_MEMO_STRUCTURAL_OVERHEAD = 100  # JSON structure, quotes, etc.
 
 # Verification Constants
 VERIFY_STATE_INTERVAL = 300  # 5 minutes
+VALIDATION_CACHE_SIZE = 200_000  # Max cached (pattern_id, tx_hash) -> validate() results
+MEMO_FIELD_MATCH_CACHE_SIZE = 8_192  # Max cached (pattern, memo_type/memo_format) -> regex match results
+
+# Database connection pool (asyncpg)
+DB_POOL_MIN_SIZE = 4  # Connections kept open when idle
+DB_POOL_MAX_SIZE = 32  # Upper bound for concurrent review, routing, response and sync queries
+MEMO_DECODE_CONCURRENCY = 8  # Max messages decoded (and handshake lookups issued) at once per account history
+
+# Handshake cache
+HANDSHAKE_CACHE_TTL = 3600  # Seconds a completed handshake lookup is reused before re-querying
+HANDSHAKE_CACHE_SIZE = 10_000  # Max cached (channel_address, channel_counterparty) -> keys entries
+SHARED_SECRET_CACHE_SIZE = 10_000  # Max ECDH shared secrets cached by CredentialManager, keyed on (secret_type, received_key)
 
 # Maximum history length
 MAX_HISTORY = 15  # TODO: rename this to something more descriptive
@@ -32,3 +48,4 @@ class SystemMemoType(Enum):
     # INITIATION_GRANT = 'discord_wallet_funding'  # TODO: Deprecate this
 
 SYSTEM_MEMO_TYPES = [memo_type.value for memo_type in SystemMemoType]
+SYSTEM_MEMO_TYPE_VALUES = frozenset(sys.intern(memo_type) for memo_type in SYSTEM_MEMO_TYPES)  # For per-memo membership checks
@@ -1,5 +1,6 @@
 # Standard imports
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Tuple
+from functools import lru_cache
 import re
 import traceback
 import asyncio
@@ -8,25 +9,81 @@ import xrpl
 from loguru import logger
 from cryptography.fernet import InvalidToken
 # Local imports
-from nodetools.models.models import MemoGroup, MemoStructure, MemoDataStructureType
+from nodetools.models.models import MemoGroup, MemoStructure, MemoDataStructureType, LEGACY_CHUNK_PATTERN
 from nodetools.utilities.compression import compress_data, decompress_data, CompressionError
 from nodetools.protocols.encryption import MessageEncryption
 from nodetools.protocols.credentials import CredentialManager
 from nodetools.utilities.credentials import SecretType
 from nodetools.configuration.configuration import NodeConfig
 
+@lru_cache(maxsize=8)
+def _secret_types_by_address(node_address: str, remembrancer_address: Optional[str]) -> Dict[str, SecretType]:
+    """Map the node's channel addresses to their SecretType (node address takes precedence)"""
+    return {
+        remembrancer_address: SecretType.REMEMBRANCER,
+        node_address: SecretType.NODE,
+    }
+
+def _determine_secret_type(address: str, node_config: NodeConfig) -> SecretType:
+    """Determine the SecretType based on the address"""
+    secret_type = _secret_types_by_address(
+        node_config.node_address, 
+        node_config.remembrancer_address
+    ).get(address)
+    if secret_type is None:
+        raise ValueError(f"No SecretType found for address: {address}")
+    return secret_type
+
+def _resolve_channel(first_tx: Dict[str, Any], node_config: NodeConfig) -> Tuple[str, str]:
+    """
+    Return (channel_address, channel_counterparty) for an encrypted memo.
+
+    Channel addresses and channel counterparties vary depending on the direction of the message.
+    For example, if the message is from the node to the user, the account is the node's address and the destination is the user's address.
+    But the channel address must always be the node's address, and the channel counterparty must always be the user's address.
+    node_config.auto_handshake_addresses corresponds to the node's addresses that support encrypted channels.
+    """
+    if first_tx['destination'] in node_config.auto_handshake_addresses:
+        return first_tx['destination'], first_tx['account']
+    # The message is from the user to the node
+    return first_tx['account'], first_tx['destination']
+
+async def _get_channel_shared_secret(
+    channel_address: str,
+    channel_counterparty: str,
+    credential_manager: CredentialManager,
+    message_encryption: MessageEncryption,
+    node_config: NodeConfig
+) -> Optional[bytes]:
+    """
+    Derive the ECDH shared secret for a channel, shared by the legacy and standardized processors.
+    Returns None if no handshake exists for the channel yet.
+    """
+    # Determine secret type based on receiving address
+    secret_type = _determine_secret_type(channel_address, node_config)
+
+    # Get handshake keys
+    channel_key, counterparty_key = await message_encryption.get_handshake_for_address(
+        channel_address=channel_address,
+        channel_counterparty=channel_counterparty
+    )
+    if not (channel_key and counterparty_key):
+        return None
+
+    # Get shared secret using credential manager's API (cached there; a miss is blocking sqlite + ECDH, run off the event loop)
+    return await asyncio.to_thread(
+        credential_manager.get_shared_secret,
+        received_key=counterparty_key,
+        secret_type=secret_type
+    )
+
 class LegacyMemoProcessor:
     """Handles processing of legacy format memos"""
     
     @staticmethod
     def _determine_secret_type(address: str, node_config: NodeConfig) -> SecretType:
         """Determine the SecretType based on the address"""
-        if address == node_config.node_address:
-            return SecretType.NODE
-        elif address == node_config.remembrancer_address:
-            return SecretType.REMEMBRANCER
-        else:
-            raise ValueError(f"No SecretType found for address: {address}")
+        return _determine_secret_type(address, node_config)
 
     @staticmethod
     async def process_group(
@@ -64,13 +121,13 @@ class LegacyMemoProcessor:
         processed_data = ''
         for tx in sorted_sequence:
             chunk_data = tx['memo_data']
-            if chunk_match := re.match(r'^chunk_\d+__', chunk_data):
+            if chunk_match := LEGACY_CHUNK_PATTERN.match(chunk_data):
                 chunk_data = chunk_data[len(chunk_match.group(0)):]
             processed_data += chunk_data
 
         # Handle decompression
         if processed_data.startswith('COMPRESSED__'):
-            processed_data = processed_data.replace('COMPRESSED__', '', 1)
+            processed_data = processed_data.removeprefix('COMPRESSED__')
             try:
                 processed_data = decompress_data(processed_data)
             except CompressionError: 
@@ -88,37 +145,20 @@ class LegacyMemoProcessor:
                 return processed_data
             
             # Get channel details from first transaction
-            first_tx = sorted_sequence[0]
-
-            # Channel addresses and channel counterparties vary depending on the direction of the message
-            # For example, if the message is from the node to the user, the account is the node's address and the destination is the user's address
-            # But the channel address must always be the node's address, and the channel counterparty must always be the user's address
-            # node_config.auto_handshake_addresses corresponds to the node's addresses that support encrypted channels
-            if first_tx['destination'] in node_config.auto_handshake_addresses:
-                channel_address = first_tx['destination']
-                channel_counterparty = first_tx['account']
-            else:  # The message is from the user to the node
-                channel_address = first_tx['account']
-                channel_counterparty = first_tx['destination']
+            channel_address, channel_counterparty = _resolve_channel(sorted_sequence[0], node_config)
             
             try:
-                # Determine secret type based on receiving address
-                secret_type = LegacyMemoProcessor._determine_secret_type(channel_address, node_config)
-            
-                # Get handshake keys
-                channel_key, counterparty_key = await message_encryption.get_handshake_for_address(
-                    channel_address=channel_address,
-                    channel_counterparty=channel_counterparty
+                shared_secret = await _get_channel_shared_secret(
+                    channel_address,
+                    channel_counterparty,
+                    credential_manager,
+                    message_encryption,
+                    node_config
                 )
-                if not (channel_key and counterparty_key):
+                if shared_secret is None:
                     logger.warning("LegacyMemoProcessor.process_group: Cannot decrypt message - no handshake found")
                     return processed_data
-            
-                # Get shared secret using credential manager's API
-                shared_secret = credential_manager.get_shared_secret(
-                    received_key=counterparty_key, 
-                    secret_type=secret_type
-                )
+
                 processed_data = message_encryption.process_encrypted_message(
                     processed_data, 
                     shared_secret
@@ -145,12 +185,7 @@ class StandardizedMemoProcessor:
     @staticmethod
     def _determine_secret_type(address: str, node_config: NodeConfig) -> SecretType:
         """Determines SecretType based on address"""
-        if address == node_config.node_address:
-            return SecretType.NODE
-        elif address == node_config.remembrancer_address:
-            return SecretType.REMEMBRANCER
-        else:
-            raise ValueError(f"No SecretType found for address: {address}")
+        return _determine_secret_type(address, node_config)
     
     @staticmethod
     async def process_group(
@@ -230,37 +265,20 @@ class StandardizedMemoProcessor:
                 return processed_data
 
             # Get channel details from first transaction
-            first_tx = group.memos[0]
-
-            # Channel addresses and channel counterparties vary depending on the direction of the message
-            # For example, if the message is from the node to the user, the account is the node's address and the destination is the user's address
-            # But the channel address must always be the node's address, and the channel counterparty must always be the user's address
-            # node_config.auto_handshake_addresses corresponds to the node's addresses that support encrypted channels
-            if first_tx['destination'] in node_config.auto_handshake_addresses:
-                channel_address = first_tx['destination']
-                channel_counterparty = first_tx['account']
-            else:  # The message is from the user to the node
-                channel_address = first_tx['account']
-                channel_counterparty = first_tx['destination']
+            channel_address, channel_counterparty = _resolve_channel(group.memos[0], node_config)
 
             try:
-                # Determine secret type based on receiving address
-                secret_type = StandardizedMemoProcessor._determine_secret_type(channel_address, node_config)
-            
-                # Get handshake keys
-                channel_key, counterparty_key = await message_encryption.get_handshake_for_address(
-                    channel_address=channel_address,
-                    channel_counterparty=channel_counterparty
+                shared_secret = await _get_channel_shared_secret(
+                    channel_address,
+                    channel_counterparty,
+                    credential_manager,
+                    message_encryption,
+                    node_config
                 )
-                if not (channel_key and counterparty_key):
+                if shared_secret is None:
                     logger.warning("Cannot decrypt message - no handshake found")
                     return processed_data
 
-                # Get shared secret using credential manager's API
-                shared_secret = credential_manager.get_shared_secret(
-                    received_key=counterparty_key,
-                    secret_type=secret_type
-                )
                 processed_data = message_encryption.process_encrypted_message(
                     processed_data, 
                     shared_secret
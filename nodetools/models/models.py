@@ -1,11 +1,21 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Set, Optional, Dict, Any, Pattern, TYPE_CHECKING, List
+from dataclasses import dataclass, field
+from typing import Set, Optional, Dict, Any, Pattern, TYPE_CHECKING, List, Tuple, Iterable, Mapping
+from types import MappingProxyType
 from enum import Enum
 from loguru import logger
 from decimal import Decimal
 from xrpl.models import Memo
+from nodetools.configuration.constants import TES_SUCCESS, MEMO_FIELD_MATCH_CACHE_SIZE
+from functools import lru_cache, cache
 import re
+import sys
+import threading
+
+try:
+    import hyperscan
+except ImportError:  # Optional (nodetools[fast-dispatch]); InteractionGraph then checks every pattern in turn
+    hyperscan = None
 
 if TYPE_CHECKING:
     from nodetools.protocols.credentials import CredentialManager
@@ -27,6 +37,27 @@ class MemoDataStructureType(Enum):
     CHUNK = "c"     # Chunking
     NONE = "-"      # No processing
 
+# Compiled once and shared by every module that parses chunk markers.
+# Standardized memo_format is "<encryption>.<compression>.<chunking>", e.g. "e.b.c1/4" or "-.-.-"
+_STANDARDIZED_FORMAT_PATTERN = re.compile(
+    fr'([{MemoDataStructureType.ECDH.value}{MemoDataStructureType.NONE.value}])\.'
+    fr'([{MemoDataStructureType.BROTLI.value}{MemoDataStructureType.NONE.value}])\.'
+    fr'(?:{MemoDataStructureType.NONE.value}|{MemoDataStructureType.CHUNK.value}(\d+)/(\d+)[^.]*)\Z'
+)
+LEGACY_CHUNK_PATTERN = re.compile(r'^chunk_(\d+)__')  # Legacy "chunk_N__" memo_data prefix
+
+# memo_format field character -> structure type, resolved once rather than through Enum attribute lookups per memo
+_ENCRYPTION_TYPES = {MemoDataStructureType.ECDH.value: MemoDataStructureType.ECDH}
+_COMPRESSION_TYPES = {MemoDataStructureType.BROTLI.value: MemoDataStructureType.BROTLI}
+
+def _match_standardized_format(memo_format: str) -> Optional[re.Match]:
+    """Match memo_format against _STANDARDIZED_FORMAT_PATTERN, rejecting other formats without the regex engine"""
+    # Every standardized format has its separators at fixed positions; legacy formats (usernames,
+    # MIME types) almost never do, so this check turns most of them away before running the regex
+    if memo_format[1:2] != '.' or memo_format[3:4] != '.':
+        return None
+    return _STANDARDIZED_FORMAT_PATTERN.match(memo_format)
+
 @dataclass
 class Dependencies:
     """Container for core dependencies that can be provided by NodeTools"""
@@ -38,7 +69,7 @@ class Dependencies:
     transaction_repository: 'TransactionRepository'
     message_encryption: 'MessageEncryption'
 
-@dataclass
+@dataclass(slots=True)
 class MemoStructure:
     """Describes how a memo is structured across transactions"""
     is_chunked: bool
@@ -65,54 +96,29 @@ class MemoStructure:
         """
         if not memo_format:
             return False
-        
-        parts = memo_format.split(".")
-        if len(parts) != 3:
-            return False
-        
-        encryption, compression, chunking = parts
-
-        # Validate encryption part
-        if encryption not in {MemoDataStructureType.ECDH.value, MemoDataStructureType.NONE.value}:
-            return False
-            
-        # Validate compression part
-        if compression not in {MemoDataStructureType.BROTLI.value, MemoDataStructureType.NONE.value}:
-            return False
-            
-        # Validate chunking part
-        if chunking != MemoDataStructureType.NONE.value:
-            chunk_match = re.match(fr'{MemoDataStructureType.CHUNK.value}\d+/\d+', chunking)
-            if not chunk_match:
-                return False
-                
-        return True
+        return _match_standardized_format(memo_format) is not None
     
     @classmethod
     def parse_standardized_format(cls, memo_format: str) -> 'MemoStructure':
         """Parse a validated standardized memo_format string."""
-        encryption, compression, chunking = memo_format.split(".")
+        format_match = _match_standardized_format(memo_format)
+        if format_match is None:
+            raise ValueError(f"Invalid standardized memo_format: {memo_format}")
+        return cls._from_format_match(format_match)
 
-        # Parse encryption
-        encryption_type = (
-            MemoDataStructureType.ECDH if encryption == MemoDataStructureType.ECDH.value 
-            else None
-        )
-        
-        # Parse compression
-        compression_type = (
-            MemoDataStructureType.BROTLI if compression == MemoDataStructureType.BROTLI.value 
-            else None
-        )
+    @classmethod
+    def _from_format_match(cls, format_match: re.Match) -> 'MemoStructure':
+        """Build a MemoStructure from a _STANDARDIZED_FORMAT_PATTERN match"""
+        encryption, compression, chunk_index, total_chunks = format_match.groups()
+
+        # Parse encryption and compression ("-" maps to None)
+        encryption_type = _ENCRYPTION_TYPES.get(encryption)
+        compression_type = _COMPRESSION_TYPES.get(compression)
         
         # Parse chunking
-        chunk_index = None
-        total_chunks = None
-        if chunking != MemoDataStructureType.NONE.value:
-            chunk_match = re.match(fr'{MemoDataStructureType.CHUNK.value}(\d+)/(\d+)', chunking)
-            if chunk_match:  # We know this matches from validation
-                chunk_index = int(chunk_match.group(1))
-                total_chunks = int(chunk_match.group(2))
+        if chunk_index is not None:
+            chunk_index = int(chunk_index)
+            total_chunks = int(total_chunks)
         
         return cls(
             is_chunked=chunk_index is not None,
@@ -151,15 +157,20 @@ class MemoStructure:
         memo_data = tx.get("memo_data", "")
         memo_format = tx.get("memo_format")
 
-        # Check if using standardized format
-        if cls.is_standardized_memo_format(memo_format):
-            structure = cls.parse_standardized_format(memo_format)
+        # Check if using standardized format (validated and parsed in a single match)
+        format_match = _match_standardized_format(memo_format) if memo_format else None
+        if format_match is not None:
+            structure = cls._from_format_match(format_match)
             structure.group_id = tx.get("memo_type")  # Set group_id from transaction
             return structure
 
         ## Backwards compatibility for legacy format
         # Fall back to legacy prefix detection
-        chunk_match = re.match(r'^chunk_(\d+)__', memo_data)
+        chunk_match = (
+            LEGACY_CHUNK_PATTERN.match(memo_data)
+            if memo_data.startswith("chunk_")
+            else None
+        )
         
         # Only check compression on first chunk
         is_compressed = (
@@ -216,7 +227,7 @@ class MemoGroup:
         Add a memo to the group if it belongs.
         Returns True if memo was added, False if it doesn't belong.
         """
-        if tx.get('transaction_result') != 'tesSUCCESS':
+        if tx.get('transaction_result') != TES_SUCCESS:
             return False
 
         if tx.get("memo_type") != self.group_id:
@@ -256,11 +267,10 @@ class MemoGroup:
     @property
     def chunk_indices(self) -> Set[int]:
         """Get set of available chunk indices"""
-        return {
-            MemoStructure.from_transaction(tx).chunk_index
-            for tx in self.memos
-            if MemoStructure.from_transaction(tx).chunk_index is not None
-        }
+        # Parse each memo's structure once rather than once for the filter and again for the value
+        chunk_indices = {MemoStructure.from_transaction(tx).chunk_index for tx in self.memos}
+        chunk_indices.discard(None)
+        return chunk_indices
     
 class StructuralPattern(Enum):
     """
@@ -289,7 +299,86 @@ class StructuralPattern(Enum):
                 return StructuralPattern.NEEDS_LEGACY_GROUPING
             return StructuralPattern.DIRECT_MATCH
 
-@dataclass(frozen=True)  # Making it immutable for hashability
+_REGEX_METACHARACTERS = frozenset('.^$*+?{}[]|()')
+
+_SQL_LIKE_ESCAPES = str.maketrans({'\\': '\\\\', '%': '\\%', '_': '\\_'})
+
+def _escape_sql_like(literal: str) -> str:
+    """Escape a literal for use in a SQL LIKE pattern (backslash is the default escape character)"""
+    return literal.translate(_SQL_LIKE_ESCAPES)
+
+def _ends_with_token(source: str, token: str) -> bool:
+    """Whether a regex source ends with the given token, rather than with an escaped copy of it"""
+    if not source.endswith(token):
+        return False
+    stem = source[:-len(token)]
+    return (len(stem) - len(stem.rstrip('\\'))) % 2 == 0
+
+@lru_cache(maxsize=None)
+def _regex_to_sql_like(source: str, flags: int) -> Optional[str]:
+    """
+    Translate a literal regex into an equivalent SQL LIKE pattern under `Pattern.match` semantics:
+    the literal starts the value (anywhere, if the regex begins with `.*`), and anything may follow
+    it unless the regex ends with `\\Z`.
+    Returns None if the regex uses anything other than literal characters, ends with `$` (which also
+    matches before a final newline), or starts with `.*` without DOTALL (LIKE's `%` spans newlines).
+    """
+    if flags & ~(re.UNICODE | re.DOTALL):
+        return None
+
+    prefix, suffix = '', '%'
+    if source.startswith('^'):
+        source = source[1:]  # Implied by match
+    elif source.startswith('.*'):
+        if not flags & re.DOTALL:
+            return None
+        source, prefix = source[2:], '%'
+
+    if _ends_with_token(source, '\\Z'):
+        source, suffix = source[:-2], ''
+    elif _ends_with_token(source, '.*'):
+        source = source[:-2]  # Can always match the empty string
+
+    literal = []
+    chars = iter(source)
+    for char in chars:
+        if char == '\\':
+            escaped = next(chars, None)
+            if escaped is None or escaped.isalnum():
+                return None  # Character classes, backreferences, etc.
+            literal.append(escaped)
+        elif char in _REGEX_METACHARACTERS:
+            return None
+        else:
+            literal.append(char)
+
+    return f"{prefix}{_escape_sql_like(''.join(literal))}{suffix}"
+
+def _to_sql_like(pattern: Optional[str | Pattern]) -> Optional[str]:
+    """SQL LIKE equivalent of a MemoPattern field, or None if unset or not expressible"""
+    if not pattern:
+        return None
+    if isinstance(pattern, Pattern):
+        return _regex_to_sql_like(pattern.pattern, pattern.flags)
+    return _escape_sql_like(pattern)
+
+# How MemoPattern matches a field: string equality, Pattern.match, or Pattern.match through _cached_match
+_MATCH_EXACT, _MATCH_REGEX, _MATCH_REGEX_CACHED = range(3)
+
+# memo_type/memo_format values are short and repeat across transactions and patterns (e.g. a task-ID
+# regex shared by every task pattern), so their regex results are cached. memo_data rarely repeats.
+_CACHED_REGEX_FIELDS = frozenset(('memo_type', 'memo_format'))
+
+@lru_cache(maxsize=MEMO_FIELD_MATCH_CACHE_SIZE)
+def _cached_match(pattern: Pattern, value: str) -> bool:
+    """Pattern.match for memo_type/memo_format; equal compiled patterns share entries"""
+    return pattern.match(value) is not None
+
+def _memo_pattern_key(value: Optional[str | Pattern]) -> Any:
+    """Comparison key for a MemoPattern field: compiled patterns compare by their source"""
+    return ('re', value.pattern) if isinstance(value, Pattern) else value
+
+@dataclass(frozen=True, slots=True)  # Making it immutable for hashability
 class MemoPattern:
     """
     Defines patterns for matching processed XRPL memos.
@@ -298,6 +387,43 @@ class MemoPattern:
     memo_type: Optional[str | Pattern] = None
     memo_format: Optional[str | Pattern] = None
     memo_data: Optional[str | Pattern] = None
+    # Comparison key and hash are computed once; patterns are looked up on every routed transaction
+    _key: tuple = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+    # SQL LIKE translations are fixed for the pattern's lifetime, so they're computed up front too
+    _sql_like: Dict[str, Optional[str]] = field(init=False, repr=False, compare=False)
+    # (field name, match kind, operand) for each set field, in matching order, so matches() is one flat loop
+    _checks: Tuple[Tuple[str, int, Any], ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        key = (
+            _memo_pattern_key(self.memo_type),
+            _memo_pattern_key(self.memo_format),
+            _memo_pattern_key(self.memo_data),
+        )
+        object.__setattr__(self, '_key', key)
+        object.__setattr__(self, '_hash', hash(key))
+        object.__setattr__(self, '_sql_like', {
+            'memo_type': _to_sql_like(self.memo_type),
+            'memo_format': _to_sql_like(self.memo_format),
+            'memo_data': _to_sql_like(self.memo_data),
+        })
+        checks = []
+        for field_name, value in (
+            ('memo_type', self.memo_type),
+            ('memo_format', self.memo_format),
+            ('memo_data', self.memo_data),
+        ):
+            if not value:
+                continue
+            if not isinstance(value, Pattern):
+                # Interned to match normalize_transaction, so equal values compare by identity
+                checks.append((field_name, _MATCH_EXACT, sys.intern(value)))
+            elif field_name in _CACHED_REGEX_FIELDS:
+                checks.append((field_name, _MATCH_REGEX_CACHED, value))
+            else:
+                checks.append((field_name, _MATCH_REGEX, value.match))
+        object.__setattr__(self, '_checks', tuple(checks))
 
     def get_message_structure(self, tx: Dict[str, Any]) -> MemoStructure:
         """Extract structural information from the memo fields"""
@@ -305,58 +431,55 @@ class MemoPattern:
 
     def matches(self, tx: Dict[str, Any]) -> bool:
         """Check if a transaction's memo matches this pattern"""
-        if self.memo_type:
-            tx_memo_type = tx.get("memo_type")
-            if not tx_memo_type or not self._pattern_matches(self.memo_type, tx_memo_type):
+        for field_name, kind, operand in self._checks:
+            value = tx.get(field_name)
+            if not value:
                 return False
-
-        if self.memo_format:
-            tx_memo_format = tx.get("memo_format")
-            if not tx_memo_format or not self._pattern_matches(self.memo_format, tx_memo_format):
-                return False
-
-        if self.memo_data:
-            tx_memo_data = tx.get("memo_data")
-            if not tx_memo_data or not self._pattern_matches(self.memo_data, tx_memo_data):
+            if kind == _MATCH_EXACT:
+                if value != operand:
+                    return False
+            elif kind == _MATCH_REGEX_CACHED:
+                if not _cached_match(operand, value):
+                    return False
+            elif operand(value) is None:
                 return False
 
         return True
 
-    def _pattern_matches(self, pattern: str | Pattern, value: str) -> bool:
-        if isinstance(pattern, Pattern):
-            return bool(pattern.match(value))
-        return pattern == value
-    
+    def to_sql_like(self, field: str = 'memo_data') -> Optional[str]:
+        """
+        Get a SQL LIKE pattern equivalent to one of this pattern's fields, for use with
+        find_transaction_response. Translations are computed when the pattern is created,
+        so this is a dictionary lookup when called from RequestRule.find_response.
+        Returns None if the field is unset or cannot be expressed as a LIKE pattern.
+        """
+        try:
+            return self._sql_like[field]
+        except KeyError:
+            raise AttributeError(f"MemoPattern has no field '{field}'") from None
+
     def __hash__(self):
-        # Convert Pattern objects to their pattern strings for hashing
-        memo_type_hash = self.memo_type.pattern if isinstance(self.memo_type, Pattern) else self.memo_type
-        memo_format_hash = self.memo_format.pattern if isinstance(self.memo_format, Pattern) else self.memo_format
-        memo_data_hash = self.memo_data.pattern if isinstance(self.memo_data, Pattern) else self.memo_data
-        
-        return hash((memo_type_hash, memo_format_hash, memo_data_hash))
+        return self._hash
     
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, MemoPattern):
             return False
-        
-        # Compare Pattern objects by their pattern strings
-        def compare_attrs(a, b):
-            if isinstance(a, Pattern) and isinstance(b, Pattern):
-                return a.pattern == b.pattern
-            return a == b
-        
-        return (compare_attrs(self.memo_type, other.memo_type) and
-                compare_attrs(self.memo_format, other.memo_format) and
-                compare_attrs(self.memo_data, other.memo_data))
+        # Pattern objects compare by their pattern strings
+        return self._hash == other._hash and self._key == other._key
 
 @dataclass
 class InteractionPattern:
     memo_pattern: MemoPattern
     transaction_type: InteractionType
-    valid_responses: Set[MemoPattern]
+    valid_responses: Tuple[MemoPattern, ...]
     notify: bool = False
 
     def __post_init__(self):
+        # Stored as a tuple (deduplicated, in the order given): it is only ever iterated,
+        # and ResponseQueueRouter routes to the first entry, which a set leaves unspecified
+        self.valid_responses = tuple(dict.fromkeys(self.valid_responses)) if self.valid_responses else ()
         # Validate that RESPONSE types don't have valid_responses
         if self.transaction_type == InteractionType.RESPONSE and self.valid_responses:
             raise ValueError("RESPONSE types cannot have valid_responses")
@@ -364,17 +487,56 @@ class InteractionPattern:
         if self.transaction_type == InteractionType.REQUEST and not self.valid_responses:
             raise ValueError("REQUEST types must have valid_responses")
 
+# Constructs hyperscan's PCRE dialect reads differently from Python's `re`, so patterns using them aren't
+# prefiltered: letter escapes other than the ones both agree on (shorthand classes use hyperscan's own
+# Unicode tables, and `\N{...}` is a named character only in Python), `{,n}` (a literal in PCRE) and
+# POSIX brackets such as `[[:alpha:]]`. `\Z` is kept: in PCRE it also matches before a final newline,
+# which only widens the prefilter.
+_HYPERSCAN_DIALECT_MISMATCH = re.compile(r'\\[^\W\d_AZnrtfx]|\{,|\[[:.=]')
+
 class InteractionGraph:
     def __init__(self):
         self.patterns: Dict[str, InteractionPattern] = {}
         self.memo_pattern_to_id: Dict[MemoPattern, str] = {}
+        # Optional hyperscan prefilter over memo_data, rebuilt lazily whenever patterns change
+        self._hs_database = None
+        self._hs_pattern_ids: List[Tuple[str, ...]] = []  # hyperscan expression id -> pattern_ids
+        self._prefiltered_ids: Set[str] = set()
+        self._hs_local = threading.local()  # Per-thread scratch space: hyperscan scans can't share one
+        # memo_type -> patterns that can match it, in priority order; patterns whose memo_type is an
+        # exact string are only candidates for that memo_type, the rest are candidates for every memo_type
+        self._candidates_by_memo_type: Dict[str, Tuple[Tuple[str, InteractionPattern], ...]] = {}
+        self._untyped_candidates: Tuple[Tuple[str, InteractionPattern], ...] = ()
+        self._dispatch_stale = True
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Support pickling a compiled graph, e.g. to hand it to worker processes at startup.
+        The hyperscan database is carried in serialized form so it isn't recompiled on load.
+        """
+        state = self.__dict__.copy()
+        del state['_hs_local']  # Scratch space is per thread and per process
+        if self._hs_database is not None:
+            state['_hs_database'] = hyperscan.dumpb(self._hs_database)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._hs_local = threading.local()
+        if self._hs_database is not None:
+            if hyperscan is None:
+                # Unpickled where hyperscan isn't installed: rebuild the dispatch without it on next use
+                self._hs_database = None
+                self._dispatch_stale = True
+            else:
+                self._hs_database = hyperscan.loadb(self._hs_database, hyperscan.HS_MODE_BLOCK)
 
     def add_pattern(
             self,
             pattern_id: str,
             memo_pattern: MemoPattern,
             transaction_type: InteractionType,
-            valid_responses: Optional[Set[MemoPattern]] = None,
+            valid_responses: Optional[Iterable[MemoPattern]] = None,
             notify: bool = False
     ) -> None:
         """
@@ -386,7 +548,7 @@ class InteractionGraph:
             pattern_id: Unique identifier for the pattern
             memo_pattern: The memo pattern to match
             transaction_type: Type of interaction (REQUEST/RESPONSE/STANDALONE)
-            valid_responses: Set of valid response patterns (required for REQUEST type)
+            valid_responses: Valid response patterns, first being the default response (required for REQUEST type)
             notify: Whether transactions matching this pattern should trigger notifications
         """
         self.patterns[pattern_id] = InteractionPattern(
@@ -397,6 +559,135 @@ class InteractionGraph:
         )
         # Update the reverse lookup
         self.memo_pattern_to_id[memo_pattern] = pattern_id
+        self._dispatch_stale = True
+
+    def compile(self) -> None:
+        """
+        Build the memo_type index and memo_data prefilter now rather than on the first transaction looked up.
+        Patterns are fixed once the business logic is created, so this is safe to call at startup;
+        adding a pattern afterwards marks them stale and they are rebuilt on next use.
+        """
+        if self._dispatch_stale:
+            self._build_dispatch()
+
+    def _build_dispatch(self) -> None:
+        """Rebuild the memo_type index and the memo_data prefilter from the current patterns"""
+        self._build_memo_type_index()
+        self._build_memo_data_prefilter()
+        self._dispatch_stale = False
+
+    def _build_memo_type_index(self) -> None:
+        """
+        Bucket patterns by exact-string memo_type, so find_matching_pattern only tries the patterns
+        that can match a transaction's memo_type rather than every pattern in the graph.
+        """
+        typed: Dict[str, List[Tuple[int, str, InteractionPattern]]] = {}
+        untyped: List[Tuple[int, str, InteractionPattern]] = []
+        for position, (pattern_id, pattern) in enumerate(self.patterns.items()):
+            memo_type = pattern.memo_pattern.memo_type
+            if memo_type and not isinstance(memo_type, Pattern):
+                typed.setdefault(sys.intern(memo_type), []).append((position, pattern_id, pattern))
+            else:
+                untyped.append((position, pattern_id, pattern))
+
+        self._untyped_candidates = tuple((pattern_id, pattern) for _, pattern_id, pattern in untyped)
+        self._candidates_by_memo_type = {
+            memo_type: tuple((pattern_id, pattern) for _, pattern_id, pattern in sorted(entries + untyped, key=lambda e: e[0]))
+            for memo_type, entries in typed.items()
+        }
+
+    def _build_memo_data_prefilter(self) -> None:
+        """
+        Compile the memo_data patterns into one hyperscan database, used as a prefilter when the
+        optional `hyperscan` package is installed. Each expression is a pattern's source, unanchored,
+        so one scan reports every pattern whose regex occurs anywhere in memo_data; a pattern that
+        `Pattern.match` accepts always does. Patterns it doesn't report are skipped, and the ones it does
+        are still confirmed by MemoPattern.matches. Patterns with flags other than DOTALL, syntax
+        hyperscan reads differently, or syntax it can't compile are always checked directly.
+        Patterns sharing the same memo_data regex are registered once and reported together.
+        """
+        self._hs_database = None
+        self._hs_pattern_ids = []
+        self._prefiltered_ids = set()
+        if hyperscan is None:
+            return
+
+        # (source, hyperscan flags) -> IDs of the patterns using that memo_data regex
+        expression_ids: Dict[Tuple[bytes, int], List[str]] = {}
+        for pattern_id, pattern in self.patterns.items():
+            memo_data = pattern.memo_pattern.memo_data
+            if (
+                not isinstance(memo_data, Pattern)
+                or memo_data.flags & ~(re.UNICODE | re.DOTALL)
+                or _HYPERSCAN_DIALECT_MISMATCH.search(memo_data.pattern)
+            ):
+                continue
+            # ALLOWEMPTY: a pattern that can match the empty string (e.g. `.*`) is possible for every memo
+            flags = (
+                hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_ALLOWEMPTY
+                | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+                | (hyperscan.HS_FLAG_DOTALL if memo_data.flags & re.DOTALL else 0)
+            )
+            expression_ids.setdefault((memo_data.pattern.encode(), flags), []).append(pattern_id)
+        expressions = list(expression_ids)
+
+        def compile_database(indices: List[int]) -> 'hyperscan.Database':
+            database = hyperscan.Database()
+            database.compile(
+                expressions=[expressions[i][0] for i in indices],
+                ids=list(range(len(indices))),
+                flags=[expressions[i][1] for i in indices]
+            )
+            return database
+
+        # Compile each expression alone first, so a pattern hyperscan rejects (e.g. a backreference
+        # or lookbehind) is checked directly instead of disabling the prefilter for every pattern
+        supported = []
+        for i, expression in enumerate(expressions):
+            try:
+                compile_database([i])
+            except hyperscan.error as e:
+                logger.debug(f"InteractionGraph: checking memo_data patterns {expression_ids[expression]} directly, hyperscan rejected them: {e}")
+            else:
+                supported.append(i)
+        if not supported:
+            return
+
+        try:
+            database = compile_database(supported)
+        except hyperscan.error as e:
+            logger.warning(f"InteractionGraph: hyperscan could not compile memo_data patterns, checking each pattern directly: {e}")
+            return
+        self._hs_database = database
+        self._hs_pattern_ids = [tuple(expression_ids[expressions[i]]) for i in supported]
+        self._prefiltered_ids = {pattern_id for pattern_ids in self._hs_pattern_ids for pattern_id in pattern_ids}
+
+    def _match_memo_data(self, memo_data: Optional[str]) -> Optional[Set[str]]:
+        """
+        Return the IDs of prefiltered patterns whose memo_data regex occurs in memo_data, or None if the
+        prefilter is unavailable. Prefiltered patterns missing from the result cannot match.
+        """
+        if self._dispatch_stale:
+            self._build_dispatch()
+        database = self._hs_database
+        if database is None or not memo_data:
+            return None
+        try:
+            data = memo_data.encode()
+        except UnicodeEncodeError:  # Lone surrogates aren't valid UTF-8; leave the memo to Pattern.match
+            return None
+
+        local = self._hs_local
+        if getattr(local, 'database', None) is not database:
+            local.database, local.scratch = database, hyperscan.Scratch(database)
+        matched = set()
+        pattern_ids = self._hs_pattern_ids
+        database.scan(
+            data,
+            match_event_handler=lambda expression_id, *_: matched.update(pattern_ids[expression_id]),
+            scratch=local.scratch
+        )
+        return matched
 
     def is_valid_response(self, request_pattern_id: str, response_tx: Dict[str, Any]) -> bool:
         if request_pattern_id not in self.patterns:
@@ -410,11 +701,30 @@ class InteractionGraph:
 
     def find_matching_pattern(self, tx: Dict[str, Any]) -> Optional[str]:
         """Find the first pattern ID whose pattern matches the transaction"""
-        for pattern_id, pattern in self.patterns.items():
+        matched_ids = self._match_memo_data(tx.get("memo_data"))  # Also rebuilds the memo_type index if stale
+        ruled_out = self._prefiltered_ids - matched_ids if matched_ids is not None else ()
+        candidates = self._candidates_by_memo_type.get(tx.get("memo_type"), self._untyped_candidates)
+        for pattern_id, pattern in candidates:
+            if pattern_id in ruled_out:
+                continue  # Its memo_data regex can't match, so skip the other field checks too
             if pattern.memo_pattern.matches(tx):
                 return pattern_id
-            continue
         return None
+
+    def classify_batch(self, txs: Iterable[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        Find the first matching pattern ID for each transaction in a batch, in order, e.g. when
+        backfilling or replaying history. Matching only reads the memo fields, so transactions
+        with the same memo_type, memo_format and memo_data are classified once.
+        """
+        classified: Dict[Tuple[Any, Any, Any], Optional[str]] = {}
+        pattern_ids = []
+        for tx in txs:
+            key = (tx.get("memo_type"), tx.get("memo_format"), tx.get("memo_data"))
+            if key not in classified:
+                classified[key] = self.find_matching_pattern(tx)
+            pattern_ids.append(classified[key])
+        return pattern_ids
     
     def get_pattern_id_by_memo_pattern(self, memo_pattern: MemoPattern) -> Optional[str]:
         """Get the pattern ID for a given memo pattern"""
@@ -423,40 +733,117 @@ class InteractionGraph:
 class InteractionRule(ABC):
     """Base class for interaction processing rules"""
     transaction_type: InteractionType
+    # Set to True when validate() depends only on the transaction itself.
+    # The reviewer then caches results by (pattern_id, tx hash) across re-reviews.
+    cache_validation: bool = False
 
-    @abstractmethod
     async def validate(self, tx: Dict[str, Any], *args, **kwargs) -> bool:
         """
         Validate any additional business rules for an interaction
-        This is separate from the interaction pattern matching
+        This is separate from the interaction pattern matching.
+        By default, only successful transactions are valid. Override to add business rules.
         """
-        pass
+        return tx.get('transaction_result') == TES_SUCCESS
 
-@dataclass
+    async def validate_batch(self, txs: List[Dict[str, Any]], *args, **kwargs) -> List[bool]:
+        """
+        Validate a batch of transactions, e.g. when backfilling or reprocessing history.
+        Rules whose validation doesn't need to await anything should override this with
+        a plain list comprehension to avoid creating one coroutine per transaction.
+        """
+        if type(self).validate is InteractionRule.validate:
+            return [tx.get('transaction_result') == TES_SUCCESS for tx in txs]
+        return [await self.validate(tx, *args, **kwargs) for tx in txs]
+
+_EMPTY_TX_JSON: Dict[str, Any] = {}
+
+# Short transaction fields drawn from a small set of values, compared against constants on every review
+_INTERNED_TX_FIELDS = ('transaction_result', 'memo_type', 'memo_format')
+
+def normalize_transaction(tx: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Prepare a transaction for review when it enters the pipeline, returning a normalized shallow copy;
+    the caller's dict is left unchanged.
+    Fills account/destination from the parsed tx_json if the row lacks them, so rules and
+    find_response implementations read them with a single lookup, and interns the result code,
+    memo_type and memo_format. String equality, set membership and dict lookups all check identity
+    first, so comparisons against TES_SUCCESS, system memo types and the graph's memo_type index
+    short-circuit without comparing characters.
+    """
+    tx = {**tx}
+    if not tx.get('account') or not tx.get('destination'):
+        tx['account'], tx['destination'] = get_account_and_destination(tx)
+    for key in _INTERNED_TX_FIELDS:
+        value = tx.get(key)
+        if type(value) is str:
+            tx[key] = sys.intern(value)
+    return tx
+
+def get_account_and_destination(tx: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    """Get a transaction's account and destination, falling back to the parsed tx_json"""
+    tx_json = tx.get('tx_json_parsed') or _EMPTY_TX_JSON
+    return (
+        tx.get('account') or tx_json.get('Account'),
+        tx.get('destination') or tx_json.get('Destination')
+    )
+
+# TransactionReviewer only needs the response's hash, so don't ship the rest of the row
+FIND_TRANSACTION_RESPONSE_QUERY = """
+    SELECT hash FROM find_transaction_response(
+        request_account := %(account)s,
+        request_destination := %(destination)s,
+        request_time := %(request_time)s,
+        response_memo_type := %(response_memo_type)s,
+        response_memo_format := %(response_memo_format)s,
+        response_memo_data := %(response_memo_data)s,
+        require_after_request := %(require_after_request)s
+    );
+"""
+
+@dataclass(slots=True)
 class ResponseQuery:
     """Data class to hold query information for finding responses"""
     query: str
     params: Dict[str, Any]
 
+    @classmethod
+    def for_transaction_response(
+        cls,
+        request_tx: Dict[str, Any],
+        response_memo_type: str,
+        response_memo_format: Optional[str] = None,
+        response_memo_data: Optional[str] = None,
+        require_after_request: bool = True
+    ) -> 'ResponseQuery':
+        """
+        Build the standard find_transaction_response query for a request transaction.
+        Shared by RequestRule.find_response implementations so each one doesn't
+        rebuild the query text and account/destination lookups.
+        """
+        account, destination = get_account_and_destination(request_tx)
+        return cls(
+            query=FIND_TRANSACTION_RESPONSE_QUERY,
+            params={
+                'account': account,
+                'destination': destination,
+                'request_time': request_tx.get('close_time_iso'),
+                'response_memo_type': response_memo_type,
+                'response_memo_format': response_memo_format,
+                'response_memo_data': response_memo_data,
+                'require_after_request': require_after_request
+            }
+        )
+
 class RequestRule(InteractionRule):
     """Base class for rules that handle request transactions"""
     transaction_type = InteractionType.REQUEST
 
-    @abstractmethod
-    async def validate(
-        self,
-        tx: Dict[str, Any],
-        dependencies: Dependencies
-    ) -> bool:
-        """Validate transaction against business rules"""
-        pass
-
     @abstractmethod
     async def find_response(self, request_tx: Dict[str, Any]) -> Optional[ResponseQuery]:
         """Get query information for finding a valid response transaction"""
         pass
 
-@dataclass
+@dataclass(slots=True)
 class ResponseParameters:
     """Standardized response parameters for transaction construction"""
     source: str  # Name of the address that should send the response
@@ -501,10 +888,25 @@ class StandaloneRule(InteractionRule):
 class BusinessLogicProvider(ABC):
     """Abstract base class that defines required business logic interface"""
     transaction_graph: InteractionGraph
-    pattern_rule_map: Dict[str, InteractionRule]  # Maps pattern_id to rule instance
+    pattern_rule_map: Mapping[str, InteractionRule]  # Maps pattern_id to rule instance
+
+    def __post_init__(self):
+        # A provider may be shared between callers (see shared()), so expose its rules read-only
+        if not isinstance(self.pattern_rule_map, MappingProxyType):
+            self.pattern_rule_map = MappingProxyType(dict(self.pattern_rule_map))
 
     @classmethod
     @abstractmethod
     def create(cls) -> 'BusinessLogicProvider':
-        """Factory method that implementations must provide"""
+        """Factory method that implementations must provide. Each call builds a new provider."""
         pass
+
+    @classmethod
+    @cache
+    def shared(cls) -> 'BusinessLogicProvider':
+        """
+        The provider built by the first call to cls.create(), reused by every later call, so
+        callers across the process share one interaction graph and rule set.
+        Use `BusinessLogicProvider.shared.cache_clear()` to force a rebuild (e.g. in tests).
+        """
+        return cls.create()
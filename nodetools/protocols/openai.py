@@ -1,4 +1,4 @@
-from typing import Protocol
+from typing import Protocol, Optional
 
 class OpenAIRequestTool(Protocol):
     def request_openai_completion(self, prompt: str, model: str, max_tokens: int) -> str:
@@ -9,4 +9,12 @@ class OpenAIRequestTool(Protocol):
 
     async def o1_preview_simulated_request_async(self, system_prompt: str, user_prompt: str) -> str:
         ...
-    
\ No newline at end of file
+
+    async def submit_batch_chat_completions(self, arg_async_map: dict, completion_window: str = '24h') -> str:
+        ...
+
+    async def get_batch_chat_completions(self, batch_id: str) -> Optional[dict]:
+        ...
+
+    async def run_batch_chat_completions(self, arg_async_map: dict, poll_interval: int = 60) -> dict:
+        ...
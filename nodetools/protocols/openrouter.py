@@ -30,7 +30,9 @@ class OpenRouterTool(Protocol):
         model: str,
         system_prompt: str,
         user_prompt: str,
-        temperature: float = 0
+        temperature: float = 0,
+        cache_system_prompt: bool = False,
+        use_cache: bool = False
     ) -> Dict[str, Any]:
         """
         Create a single chat completion with system and user prompts.
@@ -40,6 +42,8 @@ class OpenRouterTool(Protocol):
             system_prompt: The system prompt to set context
             user_prompt: The user's prompt/question
             temperature: Sampling temperature (default: 0 for deterministic output)
+            cache_system_prompt: If True, mark the system prompt as a prompt-cache breakpoint
+            use_cache: If True and temperature is 0, reuse a previous response for identical prompts
             
         Returns:
             Dict containing the completion response
@@ -145,6 +145,23 @@ class TransactionRepository(Protocol):
         """
         ...
 
+    async def get_latest_memos_by_direction(
+        self,
+        account_address: str,
+        pft_only: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Get the most recent incoming and most recent outgoing memo for an account.
+        
+        Args:
+            account_address: XRPL account address to get memos for
+            pft_only: If True, only consider transactions with PFT amounts
+            
+        Returns:
+            Up to two dictionaries (one per direction) with hash, memo_type, memo_data,
+            datetime, direction and directional_pft
+        """
+        ...
+
     async def get_address_handshakes(
         self,
         channel_address: str,
@@ -8,4 +8,31 @@ CREATE INDEX IF NOT EXISTS idx_memo_fields
 CREATE INDEX IF NOT EXISTS idx_pft_holders_balance
     ON pft_holders(balance);
 CREATE INDEX IF NOT EXISTS idx_authorized_addresses_source 
-    ON authorized_addresses(auth_source, auth_source_user_id);
\ No newline at end of file
+    ON authorized_addresses(auth_source, auth_source_user_id);
+-- Trigram index so memo_data LIKE / regex filters (e.g. find_transaction_response) avoid sequential scans.
+-- Creating the pg_trgm extension needs CREATE privilege on the database (superuser before PostgreSQL 13)
+-- and the contrib package installed. Without them initialization continues without the index;
+-- run `CREATE EXTENSION pg_trgm;` as an administrator and re-run initialization to add it.
+DO $$
+BEGIN
+    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+EXCEPTION
+    WHEN insufficient_privilege OR undefined_file THEN
+        RAISE NOTICE 'pg_trgm extension unavailable (%), skipping idx_memo_data_trgm', SQLERRM;
+END
+$$;
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm') THEN
+        CREATE INDEX IF NOT EXISTS idx_memo_data_trgm
+            ON transaction_memos USING gin (memo_data gin_trgm_ops);
+    END IF;
+END
+$$;
+-- Lets the destination side of "account = $1 OR destination = $1" history lookups use an index
+CREATE INDEX IF NOT EXISTS idx_destination_datetime
+    ON transaction_memos(destination, datetime DESC);
+-- Latest successful memo of a given type, without scanning failed transactions
+CREATE INDEX IF NOT EXISTS idx_memo_type_datetime_success
+    ON transaction_memos(memo_type, datetime DESC)
+    WHERE transaction_result = 'tesSUCCESS';
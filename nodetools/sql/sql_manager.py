@@ -1,9 +1,16 @@
 from importlib import resources
+from functools import lru_cache
 import pathlib
 from typing import Optional
 from loguru import logger
 import traceback
 
+@lru_cache(maxsize=None)
+def _read_package_query(package_path: str, name: str) -> str:
+    """Read a packaged SQL file. Packaged SQL doesn't change at runtime, so each file is read once per process."""
+    with resources.files(package_path).joinpath(f"{name}.sql").open('r') as f:
+        return f.read()
+
 class SQLManager:
     """Manages SQL script loading and execution"""
     
@@ -42,8 +49,7 @@ class SQLManager:
             # Use package resources
             try:
                 package_path = f"nodetools.sql.{module if module else category}"
-                with resources.files(package_path).joinpath(f"{name}.sql").open('r') as f:
-                    return f.read()
+                return _read_package_query(package_path, name)
             except Exception as e:
                 logger.error(f"Failed to load SQL file: {name}.sql from {package_path}")
                 logger.error(traceback.format_exc())
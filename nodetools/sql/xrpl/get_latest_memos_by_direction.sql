@@ -0,0 +1,26 @@
+SELECT DISTINCT ON (direction)
+    hash,
+    memo_type,
+    memo_data,
+    datetime,
+    direction,
+    directional_pft
+FROM (
+    SELECT 
+        hash,
+        memo_type,
+        memo_data,
+        datetime,
+        CASE
+            WHEN destination = $1 THEN 'INCOMING'
+            ELSE 'OUTGOING'
+        END as direction,
+        CASE
+            WHEN destination = $1 THEN pft_amount
+            ELSE -pft_amount
+        END as directional_pft
+    FROM transaction_memos
+    WHERE (account = $1 OR destination = $1)
+        AND CASE WHEN $2 THEN pft_amount IS NOT NULL ELSE TRUE END
+) account_memos
+ORDER BY direction, datetime DESC NULLS LAST
\ No newline at end of file
@@ -1,3 +1,4 @@
+import re
 import time
 import json
 import requests
@@ -6,16 +7,27 @@ import pandas as pd
 from sqlalchemy import text
 from nodetools.utilities.db_manager import DBConnectionManager
 
+# Memo flags and the number of days each one keeps an address blacklisted
+FLAG_COOL_OFF_DAYS = {'YELLOW FLAG': 1, 'RED FLAG': 10}
+_FLAG_PATTERN = re.compile('|'.join(re.escape(flag_type) for flag_type in FLAG_COOL_OFF_DAYS))
+
+BLACKLIST_SHEET_URL = 'https://docs.google.com/spreadsheets/d/e/2PACX-1vSmKVJYwa5VMAPIS46dUGDG6mzvDX3DcxM5cExGkeB2PLRSTr88evyVf5oMkUUco_B11AAKwgCXg7Vp/pubhtml?gid=0&single=true'
+
 class LiveBlacklistUpdater:
-    def __init__(self, node_name, account_address, sleep_interval=300):
+    def __init__(self, node_name, account_address, sleep_interval=300, sheet_cache_ttl=900, sheet_timeout=10):
         """
         :param node_name: The node/username to connect to the database (e.g., 'postfiatfoundation')
         :param account_address: The XRPL address for which to fetch transactions
         :param sleep_interval: How frequently (in seconds) to run the update; default 300 = 5 mins
+        :param sheet_cache_ttl: How long (in seconds) a downloaded Google Sheet blacklist is reused; default 900 = 15 mins
+        :param sheet_timeout: Timeout (in seconds) for the Google Sheet request
         """
         self.node_name = node_name
         self.account_address = account_address
         self.sleep_interval = sleep_interval
+        self.sheet_cache_ttl = sheet_cache_ttl
+        self.sheet_timeout = sheet_timeout
+        self._sheet_fetched_at = None              # time.monotonic() of the last successful sheet download
 
         # DB manager for connections
         self.db_manager = DBConnectionManager()
@@ -79,6 +91,33 @@ class LiveBlacklistUpdater:
         finally:
             dbconnx.dispose()
 
+    def get_blacklist_from_sheet(self):
+        """
+        Return the blacklist published in the Google Sheet.
+        The download (plus HTML table parse) is reused for sheet_cache_ttl seconds, since the sheet
+        changes far less often than run_once is called. If a refresh fails, the last successful
+        download is used.
+        """
+        if (
+            self._sheet_fetched_at is not None
+            and time.monotonic() - self._sheet_fetched_at < self.sheet_cache_ttl
+        ):
+            return self.blacklist_from_sheet
+
+        try:
+            xtext = requests.get(BLACKLIST_SHEET_URL, timeout=self.sheet_timeout)
+            xtext.raise_for_status()
+            blacklist = pd.read_html(xtext.text)[0]
+        except Exception as e:
+            if self._sheet_fetched_at is None:
+                raise
+            print(f"Error refreshing blacklist sheet, using cached copy: {e}")
+            return self.blacklist_from_sheet
+
+        self.blacklist_from_sheet = list(blacklist['Unnamed: 1'])  # Store for auditing
+        self._sheet_fetched_at = time.monotonic()
+        return self.blacklist_from_sheet
+
     def run_once(self):
         """
         Runs one iteration of the entire process: fetch transactions,
@@ -94,48 +133,35 @@ class LiveBlacklistUpdater:
         # 3. If you only need the first memo's text
         df["first_memo_data"] = df["decoded_memos"].apply(lambda x: x[0]["MemoData"] if x else None)
 
-        # 4. Identify flagged transactions
-        all_yellow_flag = df[df['decoded_memos'].apply(lambda x: "YELLOW FLAG" in str(x))].copy()
-        all_red_flag = df[df['decoded_memos'].apply(lambda x: "RED FLAG" in str(x))].copy()
-
-        # 5. Convert date strings to datetime
-        all_yellow_flag['datetime'] = pd.to_datetime(all_yellow_flag['close_time_iso'].apply(lambda x: str(x)[0:10]))
-        all_red_flag['datetime'] = pd.to_datetime(all_red_flag['close_time_iso'].apply(lambda x: str(x)[0:10]))
+        # 4. Identify flagged transactions: one scan per memo list finds every flag type it contains,
+        # giving one row per (transaction, flag type) so all flag types go through a single pipeline
+        memo_flags = df['decoded_memos'].astype(str).str.findall(_FLAG_PATTERN).explode().dropna()
+        flagged = df.loc[memo_flags.index, ['destination', 'close_time_iso']].assign(flag_type=memo_flags.values)
 
-        most_recent_yellow_flag = (
-            all_yellow_flag
-            .sort_values('datetime')
-            .groupby('destination')
-            .last()[['datetime']]
-            .reset_index()
-        )
-        most_recent_yellow_flag['flag_type'] = "YELLOW FLAG"
+        # 5. Convert date strings to datetime (date part only)
+        flagged['datetime'] = pd.to_datetime(flagged['close_time_iso'].astype(str).str[:10])
 
-        most_recent_red_flag = (
-            all_red_flag
-            .sort_values('datetime')
-            .groupby('destination')
-            .last()[['datetime']]
+        # Most recent flag of each type per destination, listed in FLAG_COOL_OFF_DAYS order
+        flag_order = {flag_type: i for i, flag_type in enumerate(FLAG_COOL_OFF_DAYS)}
+        flag_list = (
+            flagged
+            .groupby(['flag_type', 'destination'])['datetime']
+            .max()
             .reset_index()
+            .sort_values('flag_type', key=lambda flag_types: flag_types.map(flag_order), kind='stable')
+            [['destination', 'datetime', 'flag_type']]
+            .reset_index(drop=True)
         )
-        most_recent_red_flag['flag_type'] = "RED FLAG"
-
-        flag_list = pd.concat([most_recent_yellow_flag, most_recent_red_flag]).copy()
 
         # 6. Add day cool-off logic
-        flag_list['day_cool_off'] = flag_list['flag_type'].map({'YELLOW FLAG': 1, 'RED FLAG': 10})
-        flag_list['cool_off_datetime'] = flag_list['datetime'] + flag_list['day_cool_off'].apply(lambda x: datetime.timedelta(x))
+        flag_list['day_cool_off'] = flag_list['flag_type'].map(FLAG_COOL_OFF_DAYS)
+        flag_list['cool_off_datetime'] = flag_list['datetime'] + pd.to_timedelta(flag_list['day_cool_off'], unit='D')
         flag_list['is_currently_blacklisted'] = flag_list['cool_off_datetime'] >= datetime.datetime.now()
 
         self.flag_list_df = flag_list.copy()  # Store for auditing
 
         # 7. Pull current blacklist from Google Sheets
-        xtext = requests.get(
-            'https://docs.google.com/spreadsheets/d/e/2PACX-1vSmKVJYwa5VMAPIS46dUGDG6mzvDX3DcxM5cExGkeB2PLRSTr88evyVf5oMkUUco_B11AAKwgCXg7Vp/pubhtml?gid=0&single=true'
-        )
-        blacklist = pd.read_html(xtext.text)[0]
-        current_blacklist = list(blacklist['Unnamed: 1'])
-        self.blacklist_from_sheet = current_blacklist  # Store for auditing
+        current_blacklist = self.get_blacklist_from_sheet()
 
         # 8. Combine existing blacklist with newly flagged addresses
         accounts_frozen_due_to_flags = list(flag_list[flag_list['is_currently_blacklisted'] == True]['destination'])
@@ -5,7 +5,10 @@ from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives.hashes import SHA256
 from cryptography.fernet import Fernet
 import time
+import threading
+from collections import OrderedDict
 from enum import Enum
+from functools import lru_cache
 import nodetools.configuration.constants as global_constants
 import nodetools.configuration.configuration as config
 from nodetools.utilities.ecdh import ECDHUtils
@@ -30,11 +33,20 @@ class SecretType(Enum):
     @classmethod
     def get_secret_key(cls, secret_type):
         """Maps secret type to credential key"""
-        mapping = {
-            cls.REMEMBRANCER: f'{config.get_node_config().remembrancer_name}__v1xrpsecret',
-            cls.NODE: f'{config.get_node_config().node_name}__v1xrpsecret'
-        }
-        return mapping[secret_type]
+        return _get_secret_keys(config.RuntimeConfig.USE_TESTNET)[secret_type]
+
+@lru_cache(maxsize=None)
+def _get_secret_keys(use_testnet: bool) -> dict[SecretType, str]:
+    """
+    Build the secret type -> credential key mapping once per network, instead of
+    re-reading the node config file on every key lookup.
+    Call _get_secret_keys.cache_clear() if the node config is rewritten at runtime.
+    """
+    node_config = config.get_node_config()
+    return {
+        SecretType.REMEMBRANCER: f'{node_config.remembrancer_name}__v1xrpsecret',
+        SecretType.NODE: f'{node_config.node_name}__v1xrpsecret'
+    }
 
 class CredentialManager:
     _instance = None  # ensures we only have one instance
@@ -62,9 +74,19 @@ class CredentialManager:
             self.db_path = get_database_path()
             self.encryption_key = self._derive_encryption_key(password)
             self._key_expiry = time.time() + KEY_EXPIRY if KEY_EXPIRY >= 0 else float('inf')
+            self._ecdh_public_keys: dict[SecretType, str] = {}  # Derived once per secret type
+            # (secret_type, received_key) -> derived ECDH shared secret, most recently used last
+            self._shared_secrets: OrderedDict[tuple[SecretType, str], bytes] = OrderedDict()
+            self._shared_secrets_lock = threading.Lock()  # get_shared_secret is called from worker threads
             self._initialize_database()
             self.__class__._initialized = True
 
+    def _clear_derived_keys(self):
+        """Drop cached public keys and shared secrets, e.g. after the underlying credentials change"""
+        self._ecdh_public_keys.clear()
+        with self._shared_secrets_lock:
+            self._shared_secrets.clear()
+
     def _check_key_expiry(self):
         """Check if encryption key has expired"""
         if KEY_EXPIRY >= 0 and time.time() > self._key_expiry:
@@ -170,6 +192,7 @@ class CredentialManager:
             """, (credential_key,))
             deleted = cursor.rowcount > 0
             conn.commit()
+            self._clear_derived_keys()
             if deleted:
                 print(f"Deleted credential: {credential_key}")
             return deleted
@@ -196,6 +219,7 @@ class CredentialManager:
                     VALUES (?, ?);
                 """, (key, encrypted_value))
             conn.commit()
+            self._clear_derived_keys()
             print(f"Stored {len(credentials_dict)} credentials in {self.db_path}")
 
     def _decrypt_creds(self):
@@ -207,14 +231,21 @@ class CredentialManager:
         return {key: self._decrypt_value(value) for key, value in rows}
     
     def get_ecdh_public_key(self, secret_type: SecretType):
-        """Returns ECDH public key as hex string"""
-        secret_key = SecretType.get_secret_key(secret_type)
-        wallet_secret = self.get_credential(secret_key)
-        return ECDHUtils.get_ecdh_public_key_from_seed(wallet_secret)
+        """Returns ECDH public key as hex string, cached after the first derivation"""
+        self._check_key_expiry()  # Cache hits must not outlive the encryption key
+        public_key = self._ecdh_public_keys.get(secret_type)
+        if public_key is None:
+            secret_key = SecretType.get_secret_key(secret_type)
+            wallet_secret = self.get_credential(secret_key)
+            public_key = ECDHUtils.get_ecdh_public_key_from_seed(wallet_secret)
+            self._ecdh_public_keys[secret_type] = public_key
+        return public_key
 
     def get_shared_secret(self, received_key: str, secret_type: SecretType) -> bytes: 
         """
-        Derive a shared secret using ECDH
+        Derive a shared secret using ECDH.
+        Every memo on a channel derives the same secret, so results are cached until the
+        credentials change; the key expiry is still checked on every call.
         
         Args:
             received_key: public key received from another party
@@ -227,11 +258,25 @@ class CredentialManager:
             ValueError: if received_key is invalid or secret not found
         """
         try:
+            self._check_key_expiry()
+            cache_key = (secret_type, received_key)
+            with self._shared_secrets_lock:
+                shared_secret = self._shared_secrets.get(cache_key)
+                if shared_secret is not None:
+                    self._shared_secrets.move_to_end(cache_key)
+                    return shared_secret
+
             secret_key = SecretType.get_secret_key(secret_type)
             wallet_secret = self.get_credential(secret_key)
-            return ECDHUtils.get_shared_secret(received_key, wallet_secret)
+            shared_secret = ECDHUtils.get_shared_secret(received_key, wallet_secret)
         except Exception as e:
             raise ValueError(f"Failed to derive shared secret: {e}") from e
+
+        with self._shared_secrets_lock:
+            self._shared_secrets[cache_key] = shared_secret
+            if len(self._shared_secrets) > global_constants.SHARED_SECRET_CACHE_SIZE:
+                self._shared_secrets.popitem(last=False)
+        return shared_secret
     
     def get_all_shared_secrets(self, received_key: str) -> dict[SecretType, bytes]:
         """
@@ -1,6 +1,8 @@
 from typing import Optional, Union, ClassVar
+from collections import OrderedDict
 import base64
 import hashlib
+import time
 from cryptography.fernet import Fernet
 import pandas as pd
 from nodetools.protocols.generic_pft_utilities import GenericPFTUtilities
@@ -34,6 +36,7 @@ class MessageEncryption:
             self.pft_utilities = pft_utilities
             self.transaction_repository = transaction_repository
             self._auto_handshake_wallets = set()  # Store addresses that should auto-respond to handshakes
+            self._handshake_cache: OrderedDict[tuple[str, str], tuple[float, tuple[str, str]]] = OrderedDict()  # (address, counterparty) -> (expiry, keys)
             self.__class__._initialized = True
 
     def __post_init__(self):
@@ -132,7 +135,7 @@ class MessageEncryption:
         if not MessageEncryption.is_encrypted(message):
             return message
         
-        encrypted_content = message.replace(MessageEncryption.WHISPER_PREFIX, '')
+        encrypted_content = message.removeprefix(MessageEncryption.WHISPER_PREFIX)
         # logger.debug(f"MessageEncryption.process_encrypted_message: Decrypting {encrypted_content}...")
         decrypted_message = MessageEncryption.decrypt_message(encrypted_content, shared_secret)
 
@@ -213,6 +216,16 @@ class MessageEncryption:
                 logger.error(f"MessageEncryption.get_handshake_for_address: Invalid XRPL addresses provided: {channel_address}, {channel_counterparty}")
                 raise ValueError("Invalid XRPL addresses provided")
 
+            # Completed handshakes are reused until they expire
+            cache_key = (channel_address, channel_counterparty)
+            cached = self._handshake_cache.get(cache_key)
+            if cached is not None:
+                expires_at, keys = cached
+                if expires_at > time.monotonic():
+                    self._handshake_cache.move_to_end(cache_key)
+                    return keys
+                del self._handshake_cache[cache_key]
+
             # Query handshakes from database
             handshakes = await self.transaction_repository.get_address_handshakes(
                 channel_address=channel_address,
@@ -236,6 +249,15 @@ class MessageEncryption:
                 if sent_key and received_key:
                     break
 
+            # Only cache completed handshakes, so a pending one picks up the counterparty's key as soon as it lands
+            if sent_key and received_key:
+                self._handshake_cache[cache_key] = (
+                    time.monotonic() + global_constants.HANDSHAKE_CACHE_TTL,
+                    (sent_key, received_key)
+                )
+                if len(self._handshake_cache) > global_constants.HANDSHAKE_CACHE_SIZE:
+                    self._handshake_cache.popitem(last=False)
+
             return sent_key, received_key
         
         except Exception as e:
@@ -42,6 +42,7 @@ from nodetools.utilities.xrpl_monitor import XRPLWebSocketMonitor
 from nodetools.utilities.transaction_orchestrator import TransactionOrchestrator
 from nodetools.utilities.transaction_repository import TransactionRepository
 from nodetools.configuration.configuration import NetworkConfig, NodeConfig, RuntimeConfig
+from nodetools.models.models import LEGACY_CHUNK_PATTERN
 
 nest_asyncio.apply()
 
@@ -105,7 +106,13 @@ class GenericPFTUtilities:
     @staticmethod
     def is_over_1kb(value: Union[str, int, float]) -> bool:
         if isinstance(value, str):
-            # For strings, convert to bytes and check length
+            # A UTF-8 encoding is between 1 and 4 bytes per character, so only
+            # strings in that ambiguous range need to be encoded to check their size
+            n = len(value)
+            if n > 1024:
+                return True
+            if n <= 256:
+                return False
             return len(value.encode('utf-8')) > 1024
         elif isinstance(value, (int, float)):
             # For numbers, compare directly
@@ -263,7 +270,7 @@ class GenericPFTUtilities:
             # Check if transaction was validated and successful
             return (
                 result.get('validated', False) and
-                result.get('meta', {}).get('TransactionResult', '') == 'tesSUCCESS'
+                result.get('meta', {}).get('TransactionResult', '') == global_constants.TES_SUCCESS
             )
         except Exception as e:
             logger.error(f"Error verifying transaction response: {e}")
@@ -671,10 +678,7 @@ class GenericPFTUtilities:
             )
 
         # Check if this is a system memo type
-        is_system_memo = any(
-            memo_type == system_type.value 
-            for system_type in global_constants.SystemMemoType
-        )
+        is_system_memo = memo_type in global_constants.SYSTEM_MEMO_TYPE_VALUES
 
         # Handle encryption if requested
         if encrypt:
@@ -774,21 +778,20 @@ class GenericPFTUtilities:
             str: Reconstructed message or None if reconstruction fails
         """
         try:
-            # Get all chunks with this memo type from this account
-            memo_chunks = memo_history[
-                (memo_history['memo_type'] == memo_type) &
-                (memo_history['memo_data'].str.match(r'^chunk_\d+__'))  # Only get actual chunks
-            ].copy()
+            # Get all chunks with this memo type from this account.
+            # Filter on memo_type first so the chunk-prefix regex only runs over this message's rows
+            memo_chunks = memo_history[memo_history['memo_type'] == memo_type]
+
+            # Extract chunk numbers in the same pass that identifies actual chunks (non-chunks extract NaN)
+            chunk_numbers = memo_chunks['memo_data'].str.extract(LEGACY_CHUNK_PATTERN, expand=False)
+            is_chunk = chunk_numbers.notna()
+            memo_chunks = memo_chunks[is_chunk].copy()
 
             if memo_chunks.empty:
                 return None
             
-            # Extract chunk numbers and sort
-            def extract_chunk_number(x):
-                match = re.search(r'^chunk_(\d+)__', x)
-                return int(match.group(1)) if match else 0
-            
-            memo_chunks['chunk_number'] = memo_chunks['memo_data'].apply(extract_chunk_number)
+            # Sort chunks by time
+            memo_chunks['chunk_number'] = chunk_numbers[is_chunk].astype(int)
             memo_chunks = memo_chunks.sort_values('datetime')
 
             # Detect and handle multiple chunk sequences
@@ -827,7 +830,7 @@ class GenericPFTUtilities:
             current_sequence.sort(key=lambda x: x['chunk_number'])
             reconstructed_parts = []
             for chunk in current_sequence:
-                chunk_data = re.sub(r'^chunk_\d+__', '', chunk['memo_data'])
+                chunk_data = LEGACY_CHUNK_PATTERN.sub('', chunk['memo_data'], count=1)
                 reconstructed_parts.append(chunk_data)
 
             return ''.join(reconstructed_parts)
@@ -898,15 +901,12 @@ class GenericPFTUtilities:
             if full_unchunk and memo_history is not None:
 
                 # Skip chunk processing for SystemMemoType messages
-                is_system_memo = any(
-                    memo_type == system_type.value 
-                    for system_type in global_constants.SystemMemoType
-                )
+                is_system_memo = memo_type in global_constants.SYSTEM_MEMO_TYPE_VALUES
 
                 # Handle chunking for non-system messages only
                 if not is_system_memo:
                     # Check if this is a chunked message
-                    chunk_match = re.match(r'^chunk_\d+__', memo_data)
+                    chunk_match = LEGACY_CHUNK_PATTERN.match(memo_data)
                     if chunk_match:
                         reconstructed = self._reconstruct_chunked_message(
                             memo_type=memo_type,
@@ -917,15 +917,15 @@ class GenericPFTUtilities:
                         else:
                             # If reconstruction fails, just clean the prefix from the single message
                             # logger.warning(f"GenericPFTUtilities.process_memo_data: Reconstruction of chunked message {memo_type} from {channel_address} failed. Cleaning prefix from single message.")
-                            processed_data = re.sub(r'^chunk_\d+__', '', memo_data)
+                            processed_data = LEGACY_CHUNK_PATTERN.sub('', memo_data, count=1)
             
             elif isinstance(processed_data, str):
                 # Simple chunk prefix removal (no full unchunking)
-                processed_data = re.sub(r'^chunk_\d+__', '', processed_data)
+                processed_data = LEGACY_CHUNK_PATTERN.sub('', processed_data, count=1)
                 
             # Handle decompression
             if decompress and processed_data.startswith('COMPRESSED__'):
-                processed_data = processed_data.replace('COMPRESSED__', '', 1)
+                processed_data = processed_data.removeprefix('COMPRESSED__')
                 # logger.debug(f"GenericPFTUtilities.process_memo_data: Decompressing data: {processed_data}")
                 try:
                     processed_data = self.decompress_string(processed_data)
@@ -1013,6 +1013,7 @@ class GenericPFTUtilities:
         self,
         account_address: str,
         channel_private_key: Optional[Union[str, xrpl.wallet.Wallet]] = None,
+        max_messages: Optional[int] = None,
     ) -> pd.DataFrame:
         """Get all messages for an account, handling chunked messages, compression, and encryption.
         
@@ -1039,6 +1040,7 @@ class GenericPFTUtilities:
             account_address: XRPL account address to get history for
             channel_private_key: Private key (wallet seed or wallet) for decryption.
                 Required if any messages are encrypted.
+            max_messages: If set, only the most recent max_messages messages are reconstructed and returned.
                 
         Returns:
             DataFrame with columns:
@@ -1072,16 +1074,25 @@ class GenericPFTUtilities:
                     logger.debug(f"No messages found between {account_address} and remembrancer")
                     return pd.DataFrame()
 
+            # Drop older messages before any unchunking or decryption work is done for them
+            if max_messages is not None:
+                recent_memo_types = memo_history['memo_type'].unique()[-max_messages:] if max_messages > 0 else []
+                memo_history = memo_history[memo_history['memo_type'].isin(recent_memo_types)]
+
+                if memo_history.empty:
+                    return pd.DataFrame()
+
             # Derive channel_address from channel_private_key
             if isinstance(channel_private_key, xrpl.wallet.Wallet):
                 channel_address = channel_private_key.classic_address
             else:
                 channel_address = xrpl.wallet.Wallet.from_seed(channel_private_key).classic_address
 
-            processed_messages = []
-            for msg_id in memo_history['memo_type'].unique():
+            message_groups = []
+            decode_tasks = []
+            # One grouping pass instead of a full boolean mask over memo_history per memo_type
+            for msg_id, msg_txns in memo_history.groupby('memo_type', sort=False, dropna=False):
 
-                msg_txns = memo_history[memo_history['memo_type'] == msg_id]
                 first_txn = msg_txns.iloc[0]
 
                 # Determine channel counterparty based on account_address
@@ -1093,9 +1104,11 @@ class GenericPFTUtilities:
                     else first_txn['user_account']
                 )
 
-                try:
-                    # Process the message (handles chunking, decompression, and decryption)
-                    processed_message = await self.process_memo_data(
+                message_groups.append((msg_id, msg_txns, first_txn))
+
+                # Process the message (handles chunking, decompression, and decryption)
+                decode_tasks.append(
+                    self.process_memo_data(
                         memo_type=msg_id,
                         memo_data=first_txn['memo_data'],
                         full_unchunk=True,
@@ -1104,7 +1117,23 @@ class GenericPFTUtilities:
                         channel_counterparty=channel_counterparty,
                         channel_private_key=channel_private_key
                     )
-                except Exception as e:
+                )
+
+            # Messages are independent of each other, so their handshake lookups can run concurrently,
+            # bounded so a long history doesn't take over the connection pool
+            semaphore = asyncio.Semaphore(global_constants.MEMO_DECODE_CONCURRENCY)
+
+            async def decode(task):
+                async with semaphore:
+                    return await task
+
+            decoded_messages = await asyncio.gather(*(decode(task) for task in decode_tasks), return_exceptions=True)
+
+            processed_messages = []
+            for (msg_id, msg_txns, first_txn), processed_message in zip(message_groups, decoded_messages):
+                if isinstance(processed_message, asyncio.CancelledError):
+                    raise processed_message
+                if isinstance(processed_message, Exception):
                     processed_message = None
 
                 processed_messages.append({
@@ -1367,7 +1396,8 @@ class GenericPFTUtilities:
                 account_address=account_address,
                 channel_private_key=self.credential_manager.get_credential(
                     f"{self.node_config.remembrancer_name}__v1xrpsecret"
-                )
+                ),
+                max_messages=num_messages
             )
 
             if df.empty:
@@ -1634,15 +1664,18 @@ THIS MESSAGE WILL AUTO DELETE IN 60 SECONDS
         outgoing_messages = None
         try:
 
-            memo_history = await self.get_account_memo_history(wallet_address)
-            memo_history = memo_history.sort_values('datetime')
+            # The database picks the latest memo per direction, so only those (at most two) rows come back
+            latest_memos = await self.transaction_repository.get_latest_memos_by_direction(
+                account_address=wallet_address,
+                pft_only=True
+            )
 
             def format_transaction_message(transaction):
                 """
                 Format a transaction message with specified elements.
                 
                 Args:
-                transaction (pd.Series): A single transaction from the DataFrame.
+                transaction (dict): A single transaction row.
                 
                 Returns:
                 str: Formatted transaction message.
@@ -1654,14 +1687,11 @@ THIS MESSAGE WILL AUTO DELETE IN 60 SECONDS
                         f"Datetime: {transaction['datetime']}\n"
                         f"XRPL Explorer: {url_mask.format(hash=transaction['hash'])}")
             
-            # Only try to format if there are matching transactions
-            incoming_df = memo_history[memo_history['direction']=='INCOMING']
-            if not incoming_df.empty:
-                incoming_messages = format_transaction_message(incoming_df.tail(1).iloc[0])
-                
-            outgoing_df = memo_history[memo_history['direction']=='OUTGOING']
-            if not outgoing_df.empty:
-                outgoing_messages = format_transaction_message(outgoing_df.tail(1).iloc[0])
+            for transaction in latest_memos:
+                if transaction['direction'] == 'INCOMING':
+                    incoming_messages = format_transaction_message(transaction)
+                else:
+                    outgoing_messages = format_transaction_message(transaction)
 
         except Exception as e:
             logger.error(f"GenericPFTUtilities.get_recent_messages: Error getting recent messages for {wallet_address}: {e}")
@@ -1679,4 +1709,4 @@ THIS MESSAGE WILL AUTO DELETE IN 60 SECONDS
         Returns:
             str: Memo data with chunk prefix removed if present, otherwise unchanged
         """
-        return re.sub(r'^chunk_\d+__', '', memo_data)
+        return LEGACY_CHUNK_PATTERN.sub('', memo_data, count=1)
@@ -119,7 +119,7 @@ def check_and_create_role(base_conn_string: str) -> tuple[bool, list[str]]:
         engine = create_engine(base_conn_string)
         with engine.connect() as conn:
             # Extract username from connection string
-            user = base_conn_string.split('://')[1].split(':')[0]
+            user = base_conn_string.partition('://')[2].partition(':')[0]
 
             # Check if we have superuser privileges
             result = conn.execute(text("SELECT current_setting('is_superuser')")).scalar()
@@ -167,8 +167,8 @@ def revoke_all_privileges(db_conn_string: str) -> None:
     """Revoke all privileges from a user for testing purposes."""
     try:
         # Extract username and database from connection string
-        user = db_conn_string.split('://')[1].split(':')[0]
-        db_name = db_conn_string.split('/')[-1]
+        user = db_conn_string.partition('://')[2].partition(':')[0]
+        db_name = db_conn_string.rpartition('/')[2]
         
         print(f"Revoking privileges from user '{user}'...")
         
@@ -206,10 +206,10 @@ def create_database_if_needed(db_conn_string: str) -> bool:
     """
     try:
         # Extract database name from connection string
-        db_name = db_conn_string.split('/')[-1]
+        db_name = db_conn_string.rpartition('/')[2]
         
         # Create a connection string to the default postgres database
-        base_conn = db_conn_string.rsplit('/', 1)[0] + '/postgres'
+        base_conn = db_conn_string.rpartition('/')[0] + '/postgres'
         engine = create_engine(base_conn)
         
         with engine.connect() as conn:
@@ -394,8 +394,8 @@ def init_database(drop_tables: bool = False, create_db: bool = False):
             except Exception as e:
                 if "permission denied for schema public" in str(e):
                     print("\nPermission denied. The database exists but your user needs additional privileges.")
-                    user = db_conn_string.split('://')[1].split(':')[0]
-                    db_name = db_conn_string.split('/')[-1]
+                    user = db_conn_string.partition('://')[2].partition(':')[0]
+                    db_name = db_conn_string.rpartition('/')[2]
                     if try_fix_permissions(user, db_name):
                         print("\nPermissions fixed! Retrying initialization...")
                         return init_database(drop_tables=drop_tables, create_db=create_db)
@@ -4,6 +4,7 @@ ensuring proper sequencing and consistency of transaction processing.
 """
 # Standard imports
 from dataclasses import dataclass
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional, Tuple
 from decimal import Decimal
 import asyncio
@@ -26,7 +27,9 @@ from nodetools.models.models import (
     Dependencies,
     StructuralPattern,
     MemoGroup,
-    BusinessLogicProvider
+    BusinessLogicProvider,
+    InteractionRule,
+    normalize_transaction
 )
 from nodetools.models.memo_processor import MemoProcessor
 from nodetools.performance.monitor import PerformanceMonitor
@@ -39,7 +42,7 @@ from nodetools.protocols.xrpl_monitor import XRPLWebSocketMonitor
 from nodetools.protocols.db_manager import DBConnectionManager
 from nodetools.utilities.compression import CompressionError
 from nodetools.configuration.configuration import NodeConfig, NetworkConfig
-from nodetools.configuration.constants import VERIFY_STATE_INTERVAL
+from nodetools.configuration.constants import VERIFY_STATE_INTERVAL, VALIDATION_CACHE_SIZE, TES_SUCCESS
 
 def format_duration(seconds: float) -> str:
     """Format a duration in H:m:s format"""
@@ -47,7 +50,7 @@ def format_duration(seconds: float) -> str:
     minutes, seconds = divmod(remainder, 60)
     return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
-@dataclass
+@dataclass(slots=True)
 class ReviewingResult:
     """Represents the outcome of reviewing a single transaction"""
     tx: Dict[str, Any]
@@ -104,6 +107,9 @@ class TransactionReviewer:
         self.pattern_rule_map = business_logic.pattern_rule_map
         self.notification_queue = notification_queue
 
+        # Compile pattern matching up front so the first reviewed transaction doesn't pay for it
+        self.graph.compile()
+
         # framework dependencies
         self.dependencies = dependencies
 
@@ -112,6 +118,7 @@ class TransactionReviewer:
         self.STALE_GROUP_TIMEOUT = timedelta(minutes=10)
         self.latest_processed_time: Optional[datetime] = None
         self.is_syncing: bool = True  # Flag to indicate if we're in sync mode
+        self._validation_cache: OrderedDict[Tuple[str, str], bool] = OrderedDict()  # (pattern_id, tx_hash) -> result
 
     def end_sync_mode(self):
         self.is_syncing = False
@@ -141,6 +148,10 @@ class TransactionReviewer:
     async def review_transaction(self, tx: Dict[str, Any]) -> ReviewingResult:
         """Review a single transaction against all rules"""
 
+        # Resolve account/destination and intern the result code once, rather than in every rule.
+        # The normalized copy is what gets reviewed and returned in the ReviewingResult.
+        tx = normalize_transaction(tx)
+
         # First determine if transaction needs grouping
         structural_result = StructuralPattern.match(tx)
 
@@ -236,6 +247,28 @@ class TransactionReviewer:
                 notes=f"Failed to process group: {str(e)}"
             )
 
+    async def _validate(self, pattern_id: str, rule: InteractionRule, tx: Dict[str, Any]) -> bool:
+        """Run rule validation, reusing cached results for rules that opt in via cache_validation"""
+        # Rules that keep the default success-only validate don't need a coroutine per transaction
+        if type(rule).validate is InteractionRule.validate:
+            return tx.get('transaction_result') == TES_SUCCESS
+
+        tx_hash = tx.get('hash')
+        if not rule.cache_validation or not tx_hash:
+            return await rule.validate(tx, dependencies=self.dependencies)
+
+        key = (pattern_id, tx_hash)
+        cached = self._validation_cache.get(key)
+        if cached is not None:
+            self._validation_cache.move_to_end(key)
+            return cached
+
+        result = await rule.validate(tx, dependencies=self.dependencies)
+        self._validation_cache[key] = result
+        if len(self._validation_cache) > VALIDATION_CACHE_SIZE:
+            self._validation_cache.popitem(last=False)
+        return result
+
     async def _review_direct_match(self, tx: Dict[str, Any]) -> ReviewingResult:
         """Handle review of transactions that can be matched directly"""
         # First find matching pattern
@@ -264,7 +297,7 @@ class TransactionReviewer:
 
         try:
 
-            if await rule.validate(tx, dependencies=self.dependencies):  # Pure business rule validation
+            if await self._validate(pattern_id, rule, tx):  # Pure business rule validation
 
                 # Process based on the pattern's transaction type
                 match pattern.transaction_type:
@@ -337,7 +370,7 @@ class TransactionReviewer:
             logger.error(traceback.format_exc())
             logger.error(f"Transaction: {tx}")
     
-@dataclass
+@dataclass(slots=True)
 class ResponseRoutingResult:
     """Represents the result of determining the appropriate response pattern for a transaction"""
     success: bool
@@ -381,6 +414,9 @@ class ResponseQueueRouter:
             pattern_id: 0 for pattern_id in self.queue_configs.keys()
         }
 
+        # Request pattern ID -> response queue pattern ID, resolved once rather than per routed transaction
+        self.response_routes: Dict[str, Optional[str]] = self._initialize_response_routes()
+
     def _initialize_queue_configs(self) -> Dict[str, asyncio.Queue]:
         """Initialize queue configurations based on response patterns in business rules"""
         configs: Dict[str, QueueConfig] = {}
@@ -399,6 +435,15 @@ class ResponseQueueRouter:
     
         return configs
     
+    def _initialize_response_routes(self) -> Dict[str, Optional[str]]:
+        """Map each REQUEST pattern to the pattern ID of its first valid response (None if unregistered)"""
+        routes: Dict[str, Optional[str]] = {}
+        for pattern_id, pattern in self.graph.patterns.items():
+            if pattern.transaction_type == InteractionType.REQUEST:
+                response_pattern = pattern.valid_responses[0]
+                routes[pattern_id] = self.graph.get_pattern_id_by_memo_pattern(response_pattern)
+        return routes
+
     def get_queue_config(self, pattern_id: str) -> Optional[QueueConfig]:
         """Get the queue configuration for a given pattern ID"""
         return self.queue_configs.get(pattern_id)
@@ -417,7 +462,7 @@ class ResponseQueueRouter:
             logger.debug(f"Transaction memo_format: {tx.get('memo_format')}")
             logger.debug(f"Transaction memo_data: {tx.get('memo_data')}")
 
-            result = await self._determine_response_pattern(tx)
+            result = self._determine_response_pattern(tx)
 
             logger.debug(f"Routing result: {result}")
 
@@ -436,7 +481,7 @@ class ResponseQueueRouter:
             logger.error(traceback.format_exc())
             return False
         
-    async def _determine_response_pattern(self, tx: Dict[str, Any]) -> ResponseRoutingResult:
+    def _determine_response_pattern(self, tx: Dict[str, Any]) -> ResponseRoutingResult:
         """
         Determines which response queue a transaction should be routed to.
         
@@ -460,19 +505,16 @@ class ResponseQueueRouter:
                 notes="No matching request pattern found"
             )
         
-        request_pattern = self.graph.patterns[request_pattern_id]
-        
         # Verify it's a request type pattern
-        if request_pattern.transaction_type != InteractionType.REQUEST:
+        if request_pattern_id not in self.response_routes:
             return ResponseRoutingResult(
                 success=False,
                 pattern_id="unknown",
                 notes=f"Pattern {request_pattern_id} is not a request type"
             )
     
-        # Get the first valid response pattern
-        response_pattern = next(iter(request_pattern.valid_responses))
-        response_pattern_id = self.graph.get_pattern_id_by_memo_pattern(response_pattern)
+        # Get the pattern ID of the first valid response pattern
+        response_pattern_id = self.response_routes[request_pattern_id]
 
         if not response_pattern_id:
             return ResponseRoutingResult(
@@ -646,9 +688,12 @@ class ResponseProcessor:
             logger.debug(f"ResponseProcessor_{self.pattern_id}: Constructing response")
             response_params: ResponseParameters = await self.generator.construct_response(tx, evaluation)
 
-            # Get appropriate wallet based on source
-            node_wallet = self.dependencies.generic_pft_utilities.spawn_wallet_from_seed(
-                self.dependencies.credential_manager.get_credential(f'{response_params.source}__v1xrpsecret')
+            # Get appropriate wallet based on source.
+            # Credential decryption (sqlite + Fernet) and key derivation are blocking, so keep them off the event loop
+            node_wallet = await asyncio.to_thread(
+                lambda: self.dependencies.generic_pft_utilities.spawn_wallet_from_seed(
+                    self.dependencies.credential_manager.get_credential(f'{response_params.source}__v1xrpsecret')
+                )
             )
 
             # Send response transaction
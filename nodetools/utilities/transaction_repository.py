@@ -5,10 +5,22 @@ from nodetools.sql.sql_manager import SQLManager
 import traceback
 import json
 from decimal import Decimal
+from functools import lru_cache
 
 if TYPE_CHECKING:
     from nodetools.utilities.transaction_orchestrator import ReviewingResult
 
+@lru_cache(maxsize=256)
+def _to_positional_query(query: str, param_names: Tuple[str, ...]) -> str:
+    """
+    Convert named parameters from %(name)s to $1, $2, etc., numbered in param_names order.
+    Callers reuse a handful of query strings (e.g. FIND_TRANSACTION_RESPONSE_QUERY), so the
+    rewritten text is cached rather than rebuilt with one str.replace per parameter per call.
+    """
+    for i, name in enumerate(param_names, 1):
+        query = query.replace(f"%({name})s", f"${i}")
+    return query
+
 class TransactionRepository:
     _instance = None
     _initialized = False
@@ -23,6 +35,7 @@ class TransactionRepository:
             self.db_manager = db_manager
             self.username = username
             self._pool = None
+            self.sql_manager = SQLManager()  # Shared by every query rather than constructed per call
             self.__class__._initialized = True
 
     async def execute_query(
@@ -50,28 +63,23 @@ class TransactionRepository:
             async with pool.acquire() as conn:
                 # Convert named parameters from %(name)s to $1, $2, etc.
                 if params:
-                    # Create a mapping of param names to positions
-                    param_names = list(params.keys())
-                    for i, name in enumerate(param_names, 1):
-                        query = query.replace(f"%({name})s", f"${i}")
-                    # Convert dict to list of values in the correct order
-                    param_values = [params[name] for name in param_names]
+                    # Positions follow the dict's key order
+                    query = _to_positional_query(query, tuple(params))
+                    param_values = list(params.values())
                 else:
                     param_values = []
 
-                # Get the record schema
-                if enforce_column_structure:
-                    statement = await conn.prepare(query)
-                    attributes = statement.get_attributes()
-
                 # Execute query and fetch results
+                # conn.fetch goes through asyncpg's per-connection statement cache, so repeat queries
+                # skip parse/plan. conn.prepare() bypasses that cache, so only use it when we need
+                # the record schema for an empty result.
                 rows = await conn.fetch(query, *param_values)
 
-                if enforce_column_structure:
-                    if not rows:
-                        # Use attribute names as keys instead of Attribute objects
-                        empty_result = {attr.name: None for attr in attributes}
-                        return [empty_result]
+                if enforce_column_structure and not rows:
+                    statement = await conn.prepare(query)
+                    # Use attribute names as keys instead of Attribute objects
+                    empty_result = {attr.name: None for attr in statement.get_attributes()}
+                    return [empty_result]
 
                 return [dict(row) for row in rows]
                 
@@ -106,21 +114,16 @@ class TransactionRepository:
             pool = await self.db_manager.get_pool(self.username)
             
             async with pool.acquire() as conn:
-                sql_manager = SQLManager()
-                query = sql_manager.load_query(query_category, query_name)
-                
-                # Get the record schema
-                if enforce_column_structure:
-                    statement = await conn.prepare(query)
-                    attributes = statement.get_attributes()
+                query = self.sql_manager.load_query(query_category, query_name)
                 
+                # Statement-cached fetch; only prepare when an empty result needs its schema (see execute_query)
                 rows = await conn.fetch(query, *params)
 
-                if enforce_column_structure:
-                    if not rows:
-                        # Use attribute names as keys instead of Attribute objects
-                        empty_result = {attr.name: None for attr in attributes}
-                        return [empty_result]
+                if enforce_column_structure and not rows:
+                    statement = await conn.prepare(query)
+                    # Use attribute names as keys instead of Attribute objects
+                    empty_result = {attr.name: None for attr in statement.get_attributes()}
+                    return [empty_result]
 
                 return [dict(row) for row in rows]
 
@@ -147,7 +150,7 @@ class TransactionRepository:
             params: List of parameters for single operation or list of parameter tuples for batch
             is_batch: If True, uses executemany for batch operations
             count_query_name: Optional name of query to count affected rows. Count query must have a single parameter ($1)
-            count_params: Optional parameter for count query
+            count_params: Optional parameters for count query, bound as query arguments
             
         Returns:
             Optional[int]: Number of affected rows if count_query_name provided, None otherwise
@@ -157,8 +160,7 @@ class TransactionRepository:
             
             async with pool.acquire() as conn:
                 async with conn.transaction():
-                    sql_manager = SQLManager()
-                    query = sql_manager.load_query(query_category, query_name)
+                    query = self.sql_manager.load_query(query_category, query_name)
 
                     if is_batch:
                         await conn.executemany(query, params)
@@ -167,10 +169,8 @@ class TransactionRepository:
 
                     # Execute count query if provided
                     if count_query_name and count_params is not None:
-                        count_query = sql_manager.load_query(query_category, count_query_name)
-                        # Replace the parameter placeholder with the array string
-                        count_query = count_query.replace('$1', count_params[0])
-                        result = await conn.fetchrow(count_query)
+                        count_query = self.sql_manager.load_query(query_category, count_query_name)
+                        result = await conn.fetchrow(count_query, *count_params)
                         return result['count'] if result else 0
 
                     return None
@@ -203,6 +203,27 @@ class TransactionRepository:
             enforce_column_structure=True
         )
     
+    async def get_latest_memos_by_direction(
+        self,
+        account_address: str,
+        pft_only: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Get the most recent incoming and most recent outgoing memo for an account.
+        
+        Args:
+            account_address: XRPL account address to get memos for
+            pft_only: If True, only consider transactions with PFT amounts. Defaults to False.
+            
+        Returns:
+            Up to two dictionaries (one per direction) with hash, memo_type, memo_data,
+            datetime, direction and directional_pft
+        """
+        return await self._execute_query(
+            query_name='get_latest_memos_by_direction',
+            query_category='xrpl',
+            params=[account_address, pft_only]
+        )
+
     async def get_account_memo_histories(self, wallet_addresses: List[str]) -> List[Dict[str, Any]]:
         """Get all transaction histories for the specified wallet addresses.
         
@@ -277,6 +298,18 @@ class TransactionRepository:
             params=params
         )
 
+    @staticmethod
+    def _insert_transaction_params(tx: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Extract insert_transaction parameters from a transaction, in query order"""
+        return (
+            tx.get("hash"),
+            tx.get("ledger_index"),
+            tx.get("close_time_iso"),
+            json.dumps(tx.get("tx_json", {})),
+            json.dumps(tx.get("meta", {})),
+            tx.get("validated", False)
+        )
+
     async def batch_insert_transactions(self, tx_list: List[Dict[str, Any]]) -> int:
         """Batch insert transactions into postfiat_tx_cache.
         
@@ -290,17 +323,10 @@ class TransactionRepository:
             return 0
         
         # Prepare parameters for batch insert
-        params = [(
-            tx.get("hash"),
-            tx.get("ledger_index"),
-            tx.get("close_time_iso"),
-            json.dumps(tx.get("tx_json", {})),
-            json.dumps(tx.get("meta", {})),
-            tx.get("validated", False)
-        ) for tx in tx_list]
+        params = [self._insert_transaction_params(tx) for tx in tx_list]
 
-        # Prepare hash array for count query
-        hash_array = "ARRAY[" + ",".join(f"'{tx['hash']}'" for tx in tx_list) + "]"
+        # Bind the hashes as an array parameter so the count query text stays constant
+        hashes = [tx_params[0] for tx_params in params]
 
         # Do batch insert and count in same transaction
         return await self._execute_mutation(
@@ -309,7 +335,7 @@ class TransactionRepository:
             params=params,
             is_batch=True,
             count_query_name='count_inserted_transactions',
-            count_params=[hash_array]
+            count_params=[hashes]
         ) or 0  # Return 0 if None is returned
 
     async def insert_transaction(self, tx: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -323,14 +349,7 @@ class TransactionRepository:
         """
         try:
             # Insert the transaction
-            params = [
-                tx.get("hash"),
-                tx.get("ledger_index"),
-                tx.get("close_time_iso"),
-                json.dumps(tx.get("tx_json", {})),
-                json.dumps(tx.get("meta", {})),
-                tx.get("validated", False)
-            ]
+            params = self._insert_transaction_params(tx)
             
             await self._execute_mutation(
                 query_name='insert_transaction',
@@ -2,7 +2,7 @@ from decimal import Decimal
 from enum import Enum
 from typing import Optional
 from nodetools.configuration.configuration import NetworkConfig, NodeConfig
-from nodetools.configuration.constants import SystemMemoType
+from nodetools.configuration.constants import SYSTEM_MEMO_TYPE_VALUES
 
 class AddressType(Enum):
     """Types of special addresses"""
@@ -48,7 +48,7 @@ class TransactionRequirementService:
             Decimal: PFT requirement for the address
         """
         # System memos (like handshakes) don't require PFT
-        if memo_type and memo_type in [type.value for type in SystemMemoType]:
+        if memo_type and memo_type in SYSTEM_MEMO_TYPE_VALUES:
             return Decimal('0')
         
         # Otherwise, use base requirements by address type
@@ -209,19 +209,15 @@ class XRPLWebSocketMonitor:
 
             logger.debug(f"XRPLWebSocketMonitor: Received transaction {tx_message['hash']}, storing in database")
 
-            # First insert the transaction into the cache
-            if await self.transaction_repository.insert_transaction(tx_message):
-                # Retrieve the complete transaction record from the database
-                # to ensure consistent format, which includes decoded memo fields
-                tx = await self.transaction_repository.get_decoded_memo(tx_message['hash'])
-
-                if tx and tx['hash'] == tx_message['hash']:
-                    # Place complete transaction record into review queue
-                    await self.review_queue.put(tx)
-                else:
-                    logger.error(f"Failed to retrieve stored transaction {tx_message['hash']} from database")
+            # Insert the transaction into the cache. insert_transaction already reads back
+            # the complete record from decoded_memos, so there's no need to query it again
+            tx = await self.transaction_repository.insert_transaction(tx_message)
+
+            if tx and tx['hash'] == tx_message['hash']:
+                # Place complete transaction record into review queue
+                await self.review_queue.put(tx)
             else:
-                logger.error(f"Failed to store transaction {tx_message['hash']} in database")
+                logger.error(f"Failed to store or retrieve transaction {tx_message['hash']} from database")
 
         except Exception as e:
             logger.error(f"Error processing transaction update: {e}")
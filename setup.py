@@ -21,6 +21,10 @@ setup(
         'loguru',
         'asyncpg'
     ],
+    extras_require={
+        # Optional hyperscan prefilter for InteractionGraph's memo_data matching
+        'fast-dispatch': ['hyperscan'],
+    },
     include_package_data=True, 
     package_data={
         'nodetools': [
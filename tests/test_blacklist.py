@@ -0,0 +1,122 @@
+import json
+import unittest
+from unittest import mock
+import pandas as pd
+import requests
+from nodetools.task_processing.blacklist import BLACKLIST_SHEET_URL, FLAG_COOL_OFF_DAYS, LiveBlacklistUpdater
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+def make_updater(**kwargs) -> LiveBlacklistUpdater:
+    with mock.patch('nodetools.task_processing.blacklist.DBConnectionManager'):
+        return LiveBlacklistUpdater('postfiatfoundation', 'rAccount', **kwargs)
+
+def sheet_response(text='<table></table>'):
+    response = mock.Mock(text=text)
+    response.raise_for_status.return_value = None
+    return response
+
+class TestBlacklistSheetCache(unittest.TestCase):
+    def setUp(self):
+        self.updater = make_updater(sheet_cache_ttl=900, sheet_timeout=5)
+        self.clock = FakeClock()
+        self.sheet = pd.DataFrame({'Unnamed: 1': ['rBad1', 'rBad2']})
+        patchers = [
+            mock.patch('nodetools.task_processing.blacklist.time', self.clock),
+            mock.patch('nodetools.task_processing.blacklist.requests.get', return_value=sheet_response()),
+            mock.patch('nodetools.task_processing.blacklist.pd.read_html', side_effect=lambda text: [self.sheet]),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.get = requests.get
+
+    def test_download_uses_timeout(self):
+        self.assertEqual(self.updater.get_blacklist_from_sheet(), ['rBad1', 'rBad2'])
+        self.get.assert_called_once_with(BLACKLIST_SHEET_URL, timeout=5)
+        self.assertEqual(self.updater.blacklist_from_sheet, ['rBad1', 'rBad2'])
+
+    def test_download_is_reused_until_ttl_expires(self):
+        self.updater.get_blacklist_from_sheet()
+        self.sheet = pd.DataFrame({'Unnamed: 1': ['rBad3']})
+        self.clock.now += 899
+        self.assertEqual(self.updater.get_blacklist_from_sheet(), ['rBad1', 'rBad2'])
+        self.assertEqual(self.get.call_count, 1)
+        self.clock.now += 1
+        self.assertEqual(self.updater.get_blacklist_from_sheet(), ['rBad3'])
+        self.assertEqual(self.get.call_count, 2)
+
+    def test_failed_refresh_falls_back_to_last_download(self):
+        self.updater.get_blacklist_from_sheet()
+        self.clock.now += 900
+        self.get.side_effect = requests.exceptions.Timeout('timed out')
+        self.assertEqual(self.updater.get_blacklist_from_sheet(), ['rBad1', 'rBad2'])
+        # The fallback doesn't extend the cached copy's lifetime: the next run tries again
+        self.get.side_effect = None
+        self.get.return_value = sheet_response()
+        self.sheet = pd.DataFrame({'Unnamed: 1': ['rBad3']})
+        self.assertEqual(self.updater.get_blacklist_from_sheet(), ['rBad3'])
+
+    def test_http_error_falls_back_to_last_download(self):
+        self.updater.get_blacklist_from_sheet()
+        self.clock.now += 900
+        self.get.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError('503')
+        self.assertEqual(self.updater.get_blacklist_from_sheet(), ['rBad1', 'rBad2'])
+
+    def test_first_download_failure_raises(self):
+        self.get.side_effect = requests.exceptions.ConnectionError('offline')
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self.updater.get_blacklist_from_sheet()
+        self.assertEqual(self.updater.blacklist_from_sheet, [])
+
+def memos(*texts):
+    return json.dumps([{'Memo': {'MemoData': text.encode().hex()}} for text in texts])
+
+def reference_flag_list(df: pd.DataFrame) -> pd.DataFrame:
+    """Flag list as previously computed: one filtered copy, sort and groupby per flag type"""
+    frames = []
+    for flag_type in ('YELLOW FLAG', 'RED FLAG'):
+        flagged = df[df['decoded_memos'].apply(lambda x: flag_type in str(x))].copy()
+        flagged['datetime'] = pd.to_datetime(flagged['close_time_iso'].astype(str).str[:10])
+        most_recent = flagged.sort_values('datetime').groupby('destination').last()[['datetime']].reset_index()
+        most_recent['flag_type'] = flag_type
+        frames.append(most_recent)
+    return pd.concat(frames).reset_index(drop=True)
+
+class TestBlacklistFlagList(unittest.TestCase):
+    def test_matches_per_flag_type_pipeline(self):
+        transactions = pd.DataFrame({
+            'destination': ['rA', 'rA', 'rB', 'rB', 'rC', 'rD', 'rA'],
+            'close_time_iso': [
+                '2024-01-03T10:00:00Z', '2024-01-05T09:00:00Z', '2024-01-02T00:00:00Z', '2024-01-04T23:59:59Z',
+                '2024-01-01T12:00:00Z', '2024-01-06T00:00:00Z', '2024-01-04T08:00:00Z',
+            ],
+            'memos': [
+                memos('YELLOW FLAG: late'), memos('RED FLAG'), memos('ok', 'YELLOW FLAG'),
+                memos('YELLOW FLAG and RED FLAG'), memos('nothing'), '', memos('YELLOW FLAG'),
+            ],
+        })
+        updater = make_updater()
+        with mock.patch.object(updater, 'get_cached_transactions_for_address', return_value=transactions), \
+                mock.patch.object(updater, 'get_blacklist_from_sheet', return_value=[]), \
+                mock.patch.object(pd.DataFrame, 'to_sql'):
+            updater.run_once()
+
+        expected = reference_flag_list(updater.raw_transactions_df.assign(
+            decoded_memos=updater.raw_transactions_df['memos'].apply(LiveBlacklistUpdater.decode_memo_list)
+        ))
+        flag_list = updater.flag_list_df[['destination', 'datetime', 'flag_type']]
+        pd.testing.assert_frame_equal(flag_list, expected, check_dtype=False)
+        self.assertEqual(list(flag_list['flag_type']), ['YELLOW FLAG'] * 2 + ['RED FLAG'] * 2)
+        self.assertEqual(
+            list(updater.flag_list_df['day_cool_off']),
+            [FLAG_COOL_OFF_DAYS[flag_type] for flag_type in flag_list['flag_type']]
+        )
+
+if __name__ == '__main__':
+    unittest.main()
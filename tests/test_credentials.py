@@ -0,0 +1,40 @@
+import threading
+import unittest
+from collections import OrderedDict
+from unittest import mock
+from nodetools.utilities.credentials import CredentialManager, CredentialsExpiredError, SecretType
+
+def make_manager() -> CredentialManager:
+    manager = object.__new__(CredentialManager)  # Bypass the singleton and its password check
+    manager._ecdh_public_keys = {}
+    manager._shared_secrets = OrderedDict()
+    manager._shared_secrets_lock = threading.Lock()
+    manager._check_key_expiry = mock.Mock()
+    manager.get_credential = mock.Mock(return_value='sSeed')
+    return manager
+
+class TestEcdhPublicKeyCache(unittest.TestCase):
+    def setUp(self):
+        patchers = [
+            mock.patch('nodetools.utilities.credentials.SecretType.get_secret_key', return_value='node__v1xrpsecret'),
+            mock.patch('nodetools.utilities.credentials.ECDHUtils.get_ecdh_public_key_from_seed', return_value='02ab'),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.manager = make_manager()
+
+    def test_public_key_is_derived_once(self):
+        self.assertEqual(self.manager.get_ecdh_public_key(SecretType.NODE), '02ab')
+        self.assertEqual(self.manager.get_ecdh_public_key(SecretType.NODE), '02ab')
+        self.manager.get_credential.assert_called_once_with('node__v1xrpsecret')
+
+    def test_expiry_is_checked_on_cache_hit(self):
+        self.manager.get_ecdh_public_key(SecretType.NODE)
+        self.manager._check_key_expiry.side_effect = CredentialsExpiredError("Encryption key has expired.")
+        with self.assertRaises(CredentialsExpiredError):
+            self.manager.get_ecdh_public_key(SecretType.NODE)
+        self.assertEqual(self.manager._check_key_expiry.call_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()
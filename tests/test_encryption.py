@@ -0,0 +1,75 @@
+import asyncio
+import unittest
+from collections import OrderedDict
+from unittest import mock
+import nodetools.configuration.constants as global_constants
+from nodetools.utilities.encryption import MessageEncryption
+
+ADDRESS = 'rAddress'
+COUNTERPARTY = 'rCounterparty'
+
+def handshake_rows(sent_key='sent_key', received_key='received_key'):
+    rows = []
+    if sent_key:
+        rows.append({'direction': 'OUTGOING', 'memo_data': sent_key})
+    if received_key:
+        rows.append({'direction': 'INCOMING', 'memo_data': received_key})
+    return rows
+
+class TestHandshakeCache(unittest.TestCase):
+    def setUp(self):
+        self.encryption = object.__new__(MessageEncryption)  # Bypass the singleton
+        self.encryption.transaction_repository = mock.Mock()
+        self.encryption.transaction_repository.get_address_handshakes = mock.AsyncMock(return_value=handshake_rows())
+        self.encryption._handshake_cache = OrderedDict()
+        self.now = 1000.0
+        patcher = mock.patch('nodetools.utilities.encryption.time.monotonic', side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_handshake(self, address=ADDRESS, counterparty=COUNTERPARTY):
+        return asyncio.run(self.encryption.get_handshake_for_address(address, counterparty))
+
+    @property
+    def query_count(self):
+        return self.encryption.transaction_repository.get_address_handshakes.await_count
+
+    def test_completed_handshake_is_cached(self):
+        self.assertEqual(self.get_handshake(), ('sent_key', 'received_key'))
+        self.assertEqual(self.get_handshake(), ('sent_key', 'received_key'))
+        self.assertEqual(self.query_count, 1)
+
+    def test_cached_handshake_expires(self):
+        self.get_handshake()
+        self.now += global_constants.HANDSHAKE_CACHE_TTL - 1
+        self.get_handshake()
+        self.assertEqual(self.query_count, 1)
+        self.now += 2
+        self.get_handshake()
+        self.assertEqual(self.query_count, 2)
+
+    def test_pending_handshake_is_not_cached(self):
+        self.encryption.transaction_repository.get_address_handshakes.return_value = handshake_rows(received_key=None)
+        self.assertEqual(self.get_handshake(), ('sent_key', None))
+        self.encryption.transaction_repository.get_address_handshakes.return_value = handshake_rows()
+        self.assertEqual(self.get_handshake(), ('sent_key', 'received_key'))
+        self.assertEqual(self.query_count, 2)
+
+    def test_channel_directions_are_cached_separately(self):
+        self.get_handshake(ADDRESS, COUNTERPARTY)
+        self.encryption.transaction_repository.get_address_handshakes.return_value = handshake_rows('other_sent', 'other_received')
+        self.assertEqual(self.get_handshake(COUNTERPARTY, ADDRESS), ('other_sent', 'other_received'))
+        self.assertEqual(self.get_handshake(ADDRESS, COUNTERPARTY), ('sent_key', 'received_key'))
+        self.assertEqual(self.query_count, 2)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        with mock.patch.object(global_constants, 'HANDSHAKE_CACHE_SIZE', 2):
+            self.get_handshake(ADDRESS, 'rFirst')
+            self.get_handshake(ADDRESS, 'rSecond')
+            self.get_handshake(ADDRESS, 'rFirst')  # Hit, now most recently used
+            self.get_handshake(ADDRESS, 'rThird')
+        self.assertEqual(list(self.encryption._handshake_cache), [(ADDRESS, 'rFirst'), (ADDRESS, 'rThird')])
+        self.assertEqual(self.query_count, 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import asyncio
+import types
+import unittest
+from unittest import mock
+import pandas as pd
+import xrpl
+from nodetools.utilities.generic_pft_utilities import GenericPFTUtilities
+
+def make_utilities() -> GenericPFTUtilities:
+    utilities = object.__new__(GenericPFTUtilities)  # Bypass the singleton and its network setup
+    utilities.transaction_repository = mock.Mock()
+    utilities.network_config = types.SimpleNamespace(explorer_tx_url_mask='https://explorer/{hash}')
+    return utilities
+
+class TestGetRecentMessages(unittest.TestCase):
+    def test_formats_latest_memo_per_direction(self):
+        utilities = make_utilities()
+        utilities.transaction_repository.get_latest_memos_by_direction = mock.AsyncMock(return_value=[
+            {'hash': 'h_in', 'memo_type': 'task_1', 'memo_data': 'hello', 'datetime': '2024-01-02',
+             'direction': 'INCOMING', 'directional_pft': 10},
+            {'hash': 'h_out', 'memo_type': 'task_2', 'memo_data': 'bye', 'datetime': '2024-01-01',
+             'direction': 'OUTGOING', 'directional_pft': -5},
+        ])
+
+        incoming, outgoing = asyncio.run(utilities.get_recent_messages('rAccount'))
+
+        utilities.transaction_repository.get_latest_memos_by_direction.assert_awaited_once_with(
+            account_address='rAccount', pft_only=True
+        )
+        self.assertEqual(incoming, (
+            "Task ID: task_1\nMemo: hello\nPFT Amount: 10\nDatetime: 2024-01-02\n"
+            "XRPL Explorer: https://explorer/h_in"
+        ))
+        self.assertEqual(outgoing, (
+            "Task ID: task_2\nMemo: bye\nPFT Amount: -5\nDatetime: 2024-01-01\n"
+            "XRPL Explorer: https://explorer/h_out"
+        ))
+
+    def test_missing_direction_is_none(self):
+        utilities = make_utilities()
+        utilities.transaction_repository.get_latest_memos_by_direction = mock.AsyncMock(return_value=[
+            {'hash': 'h_out', 'memo_type': 'task_2', 'memo_data': 'bye', 'datetime': '2024-01-01',
+             'direction': 'OUTGOING', 'directional_pft': -5},
+        ])
+        incoming, outgoing = asyncio.run(utilities.get_recent_messages('rAccount'))
+        self.assertIsNone(incoming)
+        self.assertIsNotNone(outgoing)
+
+    def test_query_errors_are_logged_not_raised(self):
+        utilities = make_utilities()
+        utilities.transaction_repository.get_latest_memos_by_direction = mock.AsyncMock(side_effect=RuntimeError('db down'))
+        self.assertEqual(asyncio.run(utilities.get_recent_messages('rAccount')), (None, None))
+
+def memo_history(memo_types):
+    return pd.DataFrame([
+        {'memo_type': memo_type, 'memo_format': 'fmt', 'memo_data': f'data_{memo_type}', 'datetime': '2024-01-01',
+         'direction': 'INCOMING', 'hash': f'h_{memo_type}', 'account': 'rUser', 'destination': 'rRemembrancer',
+         'user_account': 'rUser', 'directional_pft': 1}
+        for memo_type in memo_types
+    ])
+
+class TestGetAllAccountCompressedMessages(unittest.TestCase):
+    def setUp(self):
+        self.utilities = make_utilities()
+        self.utilities.node_config = types.SimpleNamespace(remembrancer_address='rRemembrancer')
+        self.utilities.get_account_memo_history = mock.AsyncMock(return_value=memo_history(['m1', 'm2', 'm3']))
+        self.wallet = mock.Mock(spec=xrpl.wallet.Wallet, classic_address='rChannel')
+
+    def get_messages(self):
+        return asyncio.run(self.utilities.get_all_account_compressed_messages(
+            account_address='rRemembrancer', channel_private_key=self.wallet
+        ))
+
+    def test_failed_decode_is_reported_per_message(self):
+        async def process_memo_data(memo_type, **kwargs):
+            if memo_type == 'm2':
+                raise ValueError('bad chunk')
+            return f'decoded_{memo_type}'
+        self.utilities.process_memo_data = process_memo_data
+
+        messages = self.get_messages()
+        self.assertEqual(list(messages['processed_message']), ['decoded_m1', '[PROCESSING FAILED]', 'decoded_m3'])
+
+    def test_cancelled_decode_propagates(self):
+        async def process_memo_data(memo_type, **kwargs):
+            if memo_type == 'm2':
+                raise asyncio.CancelledError()
+            return f'decoded_{memo_type}'
+        self.utilities.process_memo_data = process_memo_data
+
+        with self.assertRaises(asyncio.CancelledError):
+            self.get_messages()
+
+    def test_decodes_are_bounded(self):
+        self.utilities.get_account_memo_history.return_value = memo_history([f'm{i}' for i in range(10)])
+        running = peak = 0
+
+        async def process_memo_data(memo_type, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return f'decoded_{memo_type}'
+        self.utilities.process_memo_data = process_memo_data
+
+        with mock.patch('nodetools.utilities.generic_pft_utilities.global_constants.MEMO_DECODE_CONCURRENCY', 3):
+            messages = self.get_messages()
+        self.assertEqual(len(messages), 10)
+        self.assertEqual(peak, 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,346 @@
+import asyncio
+import pickle
+import random
+import re
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+import nodetools.models.models as models
+from nodetools.models.models import BusinessLogicProvider, InteractionGraph, InteractionType, MemoPattern, StandaloneRule, normalize_transaction
+
+# memo_data regexes for dispatch tests: literals with and without `.*` wrappers, anchors, alternations,
+# and patterns the hyperscan prefilter leaves to direct checks (flags, dialect differences)
+MEMO_DATA_SOURCES = [
+    ('ACCEPT', 0),
+    ('^PROPOSED', 0),
+    (r'REFUSE\Z', 0),
+    ('.*ACCEPT.*', 0),
+    ('.*REFUSE', 0),
+    ('.*REFUSE', re.DOTALL),
+    ('.*line2.*', 0),
+    ('.*line2.*', re.DOTALL),
+    (r'.*a\.b.*', 0),
+    ('.*', 0),
+    ('', 0),
+    (r'.*\d{3}.*', 0),
+    (r'(?:OUTPUT|VERIFY) .*', 0),
+    (r'.*(?:ACC|REF)E.*', re.DOTALL),
+    (r'.*a|b', re.DOTALL),
+    (r'.*[]|]b', re.DOTALL),
+    (r'\s*ok', 0),
+    (r'a{,2}b', 0),
+    (r'.*(?P<q>q)q', 0),
+    (r'.*y\Z', 0),
+    ('ab$', 0),
+    ('.*?z', 0),
+    ('.*c\nd.*', 0),
+    ('accept', re.IGNORECASE),
+]
+
+MEMO_TYPES = ['t1', re.compile(r'.*-.*'), re.compile('t'), re.compile(r't\d'), None]
+
+MEMO_DATA_FRAGMENTS = [
+    'a', 'b', '.', 'y', 'z', 'q', '\n', ' ', 'ACCEPT', 'REFUSE', 'PROPOSED', 'OUTPUT ',
+    '123', 'ok', 'line2', 'c', 'd', ' DONE', '\x1c', '\\', '\u00e9'
+]
+
+def reference_matches(memo_pattern: MemoPattern, tx: dict) -> bool:
+    """MemoPattern.matches as originally defined: string equality or Pattern.match per field"""
+    for field_name in ('memo_type', 'memo_format', 'memo_data'):
+        pattern = getattr(memo_pattern, field_name)
+        if not pattern:
+            continue
+        value = tx.get(field_name)
+        if not value:
+            return False
+        if isinstance(pattern, re.Pattern):
+            if pattern.match(value) is None:
+                return False
+        elif pattern != value:
+            return False
+    return True
+
+def build_graph(seed: int, sources=MEMO_DATA_SOURCES):
+    """A graph of randomly combined memo_type/memo_data patterns, and its patterns in priority order"""
+    rng = random.Random(seed)
+    graph = InteractionGraph()
+    patterns = []
+    for i in range(30):
+        source, flags = rng.choice(sources)
+        memo_data = re.compile(source, flags) if rng.random() < 0.85 else rng.choice(['ACCEPT', None])
+        memo_pattern = MemoPattern(memo_type=rng.choice(MEMO_TYPES), memo_data=memo_data)
+        if memo_pattern in graph.memo_pattern_to_id:
+            continue
+        graph.add_pattern(f'pattern_{i}', memo_pattern, InteractionType.STANDALONE)
+        patterns.append((f'pattern_{i}', memo_pattern))
+    return graph, patterns
+
+def random_transactions(seed: int, count: int = 200):
+    rng = random.Random(seed)
+    return [
+        {
+            'memo_type': rng.choice(['t1', 't-2', 't3', 'x-t', '', None]),
+            'memo_data': ''.join(rng.choice(MEMO_DATA_FRAGMENTS) for _ in range(rng.randint(0, 6))),
+        }
+        for _ in range(count)
+    ]
+
+def reference_pattern_id(patterns, tx: dict):
+    return next((pattern_id for pattern_id, pattern in patterns if reference_matches(pattern, tx)), None)
+
+class TestMemoPatternSqlLike(unittest.TestCase):
+    def test_literal_is_a_prefix(self):
+        self.assertEqual(MemoPattern(memo_data=re.compile('ACCEPT')).to_sql_like(), 'ACCEPT%')
+        self.assertEqual(MemoPattern(memo_data=re.compile('^ACCEPT.*')).to_sql_like(), 'ACCEPT%')
+
+    def test_end_anchor(self):
+        self.assertEqual(MemoPattern(memo_data=re.compile(r'ACCEPT\Z')).to_sql_like(), 'ACCEPT')
+        self.assertEqual(MemoPattern(memo_data=re.compile(re.escape('a\\Z'))).to_sql_like(), 'a\\\\Z%')
+        # `$` also matches before a final newline, which LIKE can't express
+        self.assertIsNone(MemoPattern(memo_data=re.compile('ACCEPT$')).to_sql_like())
+
+    def test_leading_wildcard_needs_dotall(self):
+        self.assertEqual(MemoPattern(memo_data=re.compile('.*100%.*', re.DOTALL)).to_sql_like(), '%100\\%%')
+        self.assertIsNone(MemoPattern(memo_data=re.compile('.*ACCEPT.*')).to_sql_like())
+
+    def test_non_literal_regexes(self):
+        self.assertIsNone(MemoPattern(memo_data=re.compile(r'\d{4}-.*')).to_sql_like())
+        self.assertIsNone(MemoPattern(memo_data=re.compile('RE(W|V)ARD')).to_sql_like())
+        self.assertIsNone(MemoPattern(memo_data=re.compile('ACCEPT', re.IGNORECASE)).to_sql_like())
+
+    def test_string_fields(self):
+        memo_pattern = MemoPattern(memo_type='v1_task', memo_data=re.compile('ACCEPT'))
+        self.assertEqual(memo_pattern.to_sql_like('memo_type'), 'v1\\_task')
+        self.assertIsNone(memo_pattern.to_sql_like('memo_format'))
+
+class TestMemoPatternMatches(unittest.TestCase):
+    def test_matches_reference(self):
+        _, patterns = build_graph(6)
+        patterns.append(('format', MemoPattern(memo_format='text/plain', memo_data=re.compile('.*ACCEPT.*'))))
+        txs = random_transactions(6000) + [
+            {'memo_format': 'text/plain', 'memo_data': 'x ACCEPT'},
+            {'memo_format': 'text/html', 'memo_data': 'x ACCEPT'},
+        ]
+        for pattern_id, pattern in patterns:
+            for tx in txs:
+                with self.subTest(pattern=pattern_id, tx=tx):
+                    self.assertEqual(pattern.matches(tx), reference_matches(pattern, tx))
+
+    def test_memo_type_regex_results_are_shared(self):
+        task_patterns = [
+            MemoPattern(memo_type=re.compile(r'v1\.\d+'), memo_data=re.compile(f'.*{token}.*'))
+            for token in ('REQUEST', 'PROPOSED', 'ACCEPT')
+        ]
+        models._cached_match.cache_clear()
+        tx = {'memo_type': 'v1.23', 'memo_data': 'x ACCEPT'}
+        self.assertEqual([pattern.matches(tx) for pattern in task_patterns], [False, False, True])
+        info = models._cached_match.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 2))
+
+class TestInteractionGraphMatching(unittest.TestCase):
+    def assertMatchesReference(self, seeds=range(10)):
+        for seed in seeds:
+            graph, patterns = build_graph(seed)
+            for tx in random_transactions(seed + 1000):
+                with self.subTest(seed=seed, tx=tx):
+                    self.assertEqual(graph.find_matching_pattern(tx), reference_pattern_id(patterns, tx))
+
+    @unittest.skipIf(models.hyperscan is None, "hyperscan is not installed")
+    def test_hyperscan_prefilter(self):
+        graph, _ = build_graph(0)
+        graph.compile()
+        self.assertIsNotNone(graph._hs_database)
+        self.assertMatchesReference()
+
+    @unittest.skipIf(models.hyperscan is None, "hyperscan is not installed")
+    def test_patterns_hyperscan_rejects_are_checked_directly(self):
+        unsupported = [(r'.*(a)\1', 0), (r'.*(?<=a)b', 0)]
+        graph, patterns = build_graph(5, sources=MEMO_DATA_SOURCES + unsupported * 10)
+        graph.compile()
+        self.assertIsNotNone(graph._hs_database)
+        rejected = [
+            pattern_id for pattern_id, pattern in patterns
+            if isinstance(pattern.memo_data, re.Pattern) and (pattern.memo_data.pattern, 0) in unsupported
+        ]
+        self.assertTrue(rejected)
+        self.assertFalse(graph._prefiltered_ids & set(rejected))
+        for tx in random_transactions(5000) + [{'memo_data': 'xaa'}, {'memo_data': 'xab'}]:
+            with self.subTest(tx=tx):
+                self.assertEqual(graph.find_matching_pattern(tx), reference_pattern_id(patterns, tx))
+
+    @unittest.skipIf(models.hyperscan is None, "hyperscan is not installed")
+    def test_shared_memo_data_regex_is_registered_once(self):
+        graph = InteractionGraph()
+        response = MemoPattern(memo_type='response', memo_data=re.compile('.*TOKEN.*'))
+        graph.add_pattern('request', MemoPattern(memo_type='request', memo_data=re.compile('.*TOKEN.*')), InteractionType.REQUEST, {response})
+        graph.add_pattern('response', response, InteractionType.RESPONSE)
+        graph.add_pattern('other', MemoPattern(memo_data=re.compile('.*TOKEN.*', re.DOTALL)), InteractionType.STANDALONE)
+        graph.compile()
+        self.assertEqual(sorted(graph._hs_pattern_ids), [('other',), ('request', 'response')])
+        self.assertEqual(graph.find_matching_pattern({'memo_type': 'response', 'memo_data': 'x TOKEN'}), 'response')
+        self.assertEqual(graph.find_matching_pattern({'memo_type': 'response', 'memo_data': 'x\nTOKEN'}), 'other')
+        self.assertIsNone(graph.find_matching_pattern({'memo_type': 'request', 'memo_data': 'x'}))
+
+    def test_memo_type_index_preserves_priority(self):
+        graph = InteractionGraph()
+        graph.add_pattern('any_type', MemoPattern(memo_data=re.compile('.*FIRST.*')), InteractionType.STANDALONE)
+        graph.add_pattern('handshake', MemoPattern(memo_type='HANDSHAKE'), InteractionType.STANDALONE)
+        graph.add_pattern('regex_type', MemoPattern(memo_type=re.compile('HAND.*')), InteractionType.STANDALONE)
+        graph.add_pattern('other', MemoPattern(memo_type='OTHER'), InteractionType.STANDALONE)
+        graph.compile()
+        self.assertEqual([pattern_id for pattern_id, _ in graph._candidates_by_memo_type['HANDSHAKE']], ['any_type', 'handshake', 'regex_type'])
+        self.assertEqual(graph.find_matching_pattern({'memo_type': 'HANDSHAKE', 'memo_data': 'FIRST'}), 'any_type')
+        self.assertEqual(graph.find_matching_pattern({'memo_type': 'HANDSHAKE', 'memo_data': 'x'}), 'handshake')
+        self.assertEqual(graph.find_matching_pattern({'memo_type': 'HANDOFF', 'memo_data': 'x'}), 'regex_type')
+        self.assertIsNone(graph.find_matching_pattern({'memo_type': 'UNKNOWN', 'memo_data': 'x'}))
+
+    def test_without_hyperscan(self):
+        with mock.patch.object(models, 'hyperscan', None):
+            graph, _ = build_graph(0)
+            graph.compile()
+            self.assertIsNone(graph._hs_database)
+            self.assertMatchesReference()
+
+    def test_adding_pattern_rebuilds_prefilter(self):
+        graph = InteractionGraph()
+        graph.add_pattern('early', MemoPattern(memo_data=re.compile('.*EARLY.*')), InteractionType.STANDALONE)
+        graph.compile()
+        self.assertIsNone(graph.find_matching_pattern({'memo_data': 'x LATE'}))
+        graph.add_pattern('late', MemoPattern(memo_data=re.compile('.*LATE.*')), InteractionType.STANDALONE)
+        self.assertEqual(graph.find_matching_pattern({'memo_data': 'x LATE'}), 'late')
+
+    def test_pickled_graph_matches_original(self):
+        graph, patterns = build_graph(7)
+        graph.compile()
+        restored = pickle.loads(pickle.dumps(graph))
+        if models.hyperscan is not None:
+            self.assertIsNotNone(restored._hs_database)
+            self.assertFalse(restored._dispatch_stale)
+        for tx in random_transactions(7000):
+            with self.subTest(tx=tx):
+                self.assertEqual(restored.find_matching_pattern(tx), reference_pattern_id(patterns, tx))
+
+    @unittest.skipIf(models.hyperscan is None, "hyperscan is not installed")
+    def test_pickled_graph_loaded_without_hyperscan(self):
+        graph, patterns = build_graph(8)
+        graph.compile()
+        data = pickle.dumps(graph)
+        with mock.patch.object(models, 'hyperscan', None):
+            restored = pickle.loads(data)
+            self.assertIsNone(restored._hs_database)
+            for tx in random_transactions(8000):
+                with self.subTest(tx=tx):
+                    self.assertEqual(restored.find_matching_pattern(tx), reference_pattern_id(patterns, tx))
+
+    def test_concurrent_lookups(self):
+        graph, patterns = build_graph(3)
+        txs = random_transactions(3000, count=2000)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(graph.find_matching_pattern, txs))
+        self.assertEqual(results, [reference_pattern_id(patterns, tx) for tx in txs])
+
+class TestClassifyBatch(unittest.TestCase):
+    def test_matches_find_matching_pattern_in_order(self):
+        graph, _ = build_graph(4)
+        graph.compile()
+        txs = random_transactions(4000)
+        self.assertEqual(graph.classify_batch(txs), [graph.find_matching_pattern(tx) for tx in txs])
+        self.assertEqual(graph.classify_batch([]), [])
+
+    def test_repeated_memos_are_classified_once(self):
+        graph = InteractionGraph()
+        graph.add_pattern('accept', MemoPattern(memo_data=re.compile('.*ACCEPT.*')), InteractionType.STANDALONE)
+        txs = [
+            {'hash': 'h1', 'memo_type': 't', 'memo_data': 'x ACCEPT'},
+            {'hash': 'h2', 'memo_type': 't', 'memo_data': 'REFUSE'},
+            {'hash': 'h3', 'memo_type': 't', 'memo_data': 'x ACCEPT'},
+            {'hash': 'h4', 'memo_type': 'u', 'memo_data': 'x ACCEPT'},
+        ]
+        with mock.patch.object(graph, 'find_matching_pattern', wraps=graph.find_matching_pattern) as find:
+            self.assertEqual(graph.classify_batch(txs), ['accept', None, 'accept', 'accept'])
+        self.assertEqual(find.call_count, 3)
+
+class TestNormalizeTransaction(unittest.TestCase):
+    def test_returns_normalized_copy(self):
+        tx = {
+            'hash': 'h1', 'transaction_result': ''.join(['tes', 'SUCCESS']), 'memo_type': 'v1',
+            'tx_json_parsed': {'Account': 'rFrom', 'Destination': 'rTo'},
+        }
+        original = dict(tx)
+        normalized = normalize_transaction(tx)
+        self.assertIsNot(normalized, tx)
+        self.assertEqual(tx, original)
+        self.assertEqual((normalized['account'], normalized['destination']), ('rFrom', 'rTo'))
+        self.assertIs(normalized['transaction_result'], 'tesSUCCESS')
+
+class AmountRule(StandaloneRule):
+    async def validate(self, tx, minimum=0):
+        return tx.get('transaction_result') == 'tesSUCCESS' and tx.get('amount', 0) >= minimum
+
+class TestValidateBatch(unittest.TestCase):
+    def test_results_follow_validate_in_order(self):
+        txs = [
+            {'transaction_result': 'tesSUCCESS', 'amount': 5},
+            {'transaction_result': 'tecNO_DST', 'amount': 5},
+            {'transaction_result': 'tesSUCCESS', 'amount': 1},
+        ]
+        rule = AmountRule()
+        self.assertEqual(asyncio.run(rule.validate_batch(txs)), [True, False, True])
+        self.assertEqual(asyncio.run(rule.validate_batch(txs, minimum=2)), [True, False, False])
+        self.assertEqual(asyncio.run(rule.validate_batch([])), [])
+
+    def test_default_validation_checks_success(self):
+        txs = [{'transaction_result': 'tesSUCCESS'}, {'transaction_result': 'tecNO_DST'}, {}]
+        rule = StandaloneRule()
+        self.assertEqual(asyncio.run(rule.validate_batch(txs)), [True, False, False])
+        self.assertEqual([asyncio.run(rule.validate(tx)) for tx in txs], [True, False, False])
+
+class CountingProvider(BusinessLogicProvider):
+    created = 0
+
+    @classmethod
+    def create(cls):
+        cls.created += 1
+        return cls(transaction_graph=InteractionGraph(), pattern_rule_map={})
+
+class OtherProvider(CountingProvider):
+    created = 0
+
+class TestBusinessLogicProviderShared(unittest.TestCase):
+    def setUp(self):
+        BusinessLogicProvider.shared.cache_clear()
+        CountingProvider.created = OtherProvider.created = 0
+
+    def tearDown(self):
+        BusinessLogicProvider.shared.cache_clear()
+
+    def test_shared_builds_once_per_implementation(self):
+        provider = CountingProvider.shared()
+        self.assertIs(CountingProvider.shared(), provider)
+        self.assertEqual(CountingProvider.created, 1)
+        other = OtherProvider.shared()
+        self.assertIsInstance(other, OtherProvider)
+        self.assertIsNot(other, provider)
+
+    def test_create_still_builds_a_new_provider(self):
+        provider = CountingProvider.shared()
+        self.assertIsNot(CountingProvider.create(), provider)
+        self.assertEqual(CountingProvider.created, 2)
+
+    def test_cache_clear_forces_a_rebuild(self):
+        provider = CountingProvider.shared()
+        CountingProvider.shared.cache_clear()
+        self.assertIsNot(CountingProvider.shared(), provider)
+        self.assertEqual(CountingProvider.created, 2)
+
+    def test_pattern_rule_map_is_read_only(self):
+        rules = {'accept': StandaloneRule()}
+        provider = CountingProvider(transaction_graph=InteractionGraph(), pattern_rule_map=rules)
+        self.assertIs(provider.pattern_rule_map['accept'], rules['accept'])
+        with self.assertRaises(TypeError):
+            provider.pattern_rule_map['other'] = StandaloneRule()
+        rules['other'] = StandaloneRule()
+        self.assertNotIn('other', provider.pattern_rule_map)
+
+if __name__ == '__main__':
+    unittest.main()
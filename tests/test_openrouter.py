@@ -0,0 +1,179 @@
+import asyncio
+import types
+import unittest
+from collections import OrderedDict
+from unittest import mock
+from nodetools.ai.openrouter import OpenRouterTool
+from nodetools.configuration.constants import LLM_RESPONSE_CACHE_TTL
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+class FakeCompletions:
+    """Stands in for async_client.chat.completions, answering with the user prompt"""
+    def __init__(self):
+        self.calls = 0
+        self.error = None
+        self.delay = 0
+
+    async def create(self, model, messages, **kwargs):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return types.SimpleNamespace(
+            id=f'completion_{self.calls}',
+            model=model,
+            choices=[types.SimpleNamespace(
+                message=types.SimpleNamespace(content=messages[1]['content']),
+                finish_reason='stop'
+            )],
+            usage=types.SimpleNamespace(model_dump=lambda: {'total_tokens': 1})
+        )
+
+def make_tool(completions: FakeCompletions) -> OpenRouterTool:
+    tool = object.__new__(OpenRouterTool)  # Bypass the singleton and credential lookup
+    tool.http_referer = 'postfiat.org'
+    tool.request_times = []
+    tool._response_cache = OrderedDict()
+    tool._inflight_completions = {}
+    tool.async_client = types.SimpleNamespace(chat=types.SimpleNamespace(completions=completions))
+
+    async def no_rate_limit():
+        pass
+    tool.wait_for_rate_limit = no_rate_limit
+    return tool
+
+class TestChatCompletionCache(unittest.TestCase):
+    def setUp(self):
+        self.completions = FakeCompletions()
+        self.tool = make_tool(self.completions)
+        self.clock = FakeClock()
+        patcher = mock.patch('nodetools.ai.openrouter.time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def complete(self, model='model', system_prompt='system', user_prompt='user', **kwargs):
+        kwargs.setdefault('use_cache', True)
+        return asyncio.run(self.tool.create_single_chat_completion(model, system_prompt, user_prompt, **kwargs))
+
+    def test_identical_call_is_served_from_cache(self):
+        first = self.complete()
+        second = self.complete()
+        self.assertEqual(second, first)
+        self.assertEqual(self.completions.calls, 1)
+
+    def test_cached_response_is_a_copy(self):
+        self.complete()['choices'][0]['message']['content'] = 'mutated'
+        self.assertEqual(self.complete()['choices'][0]['message']['content'], 'user')
+
+    def test_cache_entry_expires(self):
+        self.complete()
+        self.clock.now += LLM_RESPONSE_CACHE_TTL - 1
+        self.complete()
+        self.assertEqual(self.completions.calls, 1)
+        self.clock.now += 2
+        self.complete()
+        self.assertEqual(self.completions.calls, 2)
+
+    def test_keys_separate_model_and_prompts(self):
+        self.complete(model='a', system_prompt='b|c', user_prompt='d')
+        self.complete(model='a|b', system_prompt='c', user_prompt='d')
+        self.complete(model='a', system_prompt='b', user_prompt='c|d')
+        self.complete(model='a', system_prompt='b|c', user_prompt='d')
+        self.assertEqual(self.completions.calls, 3)
+
+    def test_uncached_calls(self):
+        self.complete(use_cache=False)
+        self.complete(use_cache=False)
+        self.complete(temperature=0.7)
+        self.complete(temperature=0.7)
+        self.assertEqual(self.completions.calls, 4)
+        self.assertEqual(len(self.tool._response_cache), 0)
+
+    def test_errors_propagate_and_are_not_cached(self):
+        self.completions.error = RuntimeError('upstream failure')
+        with self.assertRaises(RuntimeError):
+            self.complete()
+        self.completions.error = None
+        self.assertEqual(self.complete()['choices'][0]['message']['content'], 'user')
+        self.assertEqual(self.completions.calls, 2)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        with mock.patch('nodetools.ai.openrouter.LLM_RESPONSE_CACHE_SIZE', 2):
+            self.complete(user_prompt='first')
+            self.complete(user_prompt='second')
+            self.complete(user_prompt='first')  # Hit, now most recently used
+            self.complete(user_prompt='third')
+            self.complete(user_prompt='first')
+            self.assertEqual(self.completions.calls, 3)
+            self.complete(user_prompt='second')
+            self.assertEqual(self.completions.calls, 4)
+
+class TestChatCompletionCoalescing(unittest.TestCase):
+    def setUp(self):
+        self.completions = FakeCompletions()
+        self.completions.delay = 0.05
+        self.tool = make_tool(self.completions)
+
+    def complete(self, user_prompt='user'):
+        return self.tool.create_single_chat_completion('model', 'system', user_prompt, use_cache=True)
+
+    def test_concurrent_identical_calls_share_one_request(self):
+        async def run():
+            return await asyncio.gather(*(self.complete() for _ in range(5)), self.complete('other'))
+        results = asyncio.run(run())
+        self.assertEqual([r['choices'][0]['message']['content'] for r in results], ['user'] * 5 + ['other'])
+        self.assertEqual(self.completions.calls, 2)
+        self.assertEqual(self.tool._inflight_completions, {})
+
+    def test_failure_propagates_to_waiters(self):
+        self.completions.error = RuntimeError('upstream failure')
+        async def run():
+            return await asyncio.gather(*(self.complete() for _ in range(3)), return_exceptions=True)
+        results = asyncio.run(run())
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+        self.assertEqual(self.completions.calls, 1)
+        self.assertEqual(self.tool._inflight_completions, {})
+
+    def test_cancelled_owner_lets_waiters_retry(self):
+        async def run():
+            owner = asyncio.create_task(self.complete())
+            await asyncio.sleep(0.01)
+            waiters = [asyncio.create_task(self.complete()) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            owner.cancel()
+            results = await asyncio.gather(*waiters)
+            with self.assertRaises(asyncio.CancelledError):
+                await owner
+            return results
+        results = asyncio.run(run())
+        self.assertEqual([r['choices'][0]['message']['content'] for r in results], ['user', 'user'])
+        self.assertEqual(self.completions.calls, 2)  # The cancelled request and one retry shared by both waiters
+        self.assertEqual(self.tool._inflight_completions, {})
+
+    def test_cancelled_waiter_leaves_owner_running(self):
+        async def run():
+            owner = asyncio.create_task(self.complete())
+            await asyncio.sleep(0.01)
+            waiter = asyncio.create_task(self.complete())
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await waiter
+            return await owner
+        result = asyncio.run(run())
+        self.assertEqual(result['choices'][0]['message']['content'], 'user')
+        self.assertEqual(self.completions.calls, 1)
+        self.assertEqual(self.tool._inflight_completions, {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import asyncio
+import unittest
+from contextlib import asynccontextmanager
+from unittest import mock
+from nodetools.sql.sql_manager import SQLManager
+from nodetools.utilities.transaction_repository import TransactionRepository
+
+def make_repository(conn) -> TransactionRepository:
+    """A TransactionRepository whose pool hands out the given connection, leaving the singleton untouched"""
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    db_manager = mock.Mock()
+    db_manager.get_pool = mock.AsyncMock(return_value=mock.Mock(acquire=acquire))
+    with mock.patch.object(TransactionRepository, '_instance', None), \
+            mock.patch.object(TransactionRepository, '_initialized', False):
+        return TransactionRepository(db_manager, 'postfiat')
+
+class TestGetLatestMemosByDirection(unittest.TestCase):
+    def test_runs_packaged_query_with_account_and_filter(self):
+        rows = [
+            {'hash': 'h1', 'direction': 'INCOMING'},
+            {'hash': 'h2', 'direction': 'OUTGOING'},
+        ]
+        conn = mock.Mock(fetch=mock.AsyncMock(return_value=rows))
+        repository = make_repository(conn)
+
+        result = asyncio.run(repository.get_latest_memos_by_direction('rAccount', pft_only=True))
+
+        self.assertEqual(result, rows)
+        query = SQLManager().load_query('xrpl', 'get_latest_memos_by_direction')
+        conn.fetch.assert_awaited_once_with(query, 'rAccount', True)
+
+    def test_query_keeps_one_row_per_direction(self):
+        query = SQLManager().load_query('xrpl', 'get_latest_memos_by_direction')
+        self.assertIn('DISTINCT ON (direction)', query)
+        self.assertIn('ORDER BY direction, datetime DESC', query)
+        for column in ('hash', 'memo_type', 'memo_data', 'datetime', 'direction', 'directional_pft'):
+            self.assertIn(column, query)
+
+if __name__ == '__main__':
+    unittest.main()